@@ -12,34 +12,68 @@ Features:
 - Adds tempo.co domain to premium article URLs
 """
 
+import gzip
+import io
 import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, TextIO, Tuple
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
 
-def sanitize_filename(title: str) -> str:
+# Precompiled patterns used for every article
+_DASH_RUN = re.compile(r'-+')
+_TAG_STRIP = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Map every ASCII character except letters, digits and "." to a hyphen.
+# Non-ASCII characters are turned into "?" first, so they map to a hyphen too.
+_FN_TRANS = str.maketrans({
+    c: '-' for c in map(chr, range(128)) if not (c.isalnum() or c == '.')
+})
+
+
+def clean_title(title: str) -> str:
+    """
+    Remove the " | tempo.co" suffix from an article title.
+    
+    Args:
+        title: Article title
+        
+    Returns:
+        Title without the site suffix
+    """
+    # A single scan that splits at most once
+    return title.split(" | tempo.co", 1)[0]
+
+
+def sanitize_filename(title: str, is_clean: bool = False) -> str:
     """
     Create a filesystem-safe filename from article title.
     
     Args:
         title: Article title
+        is_clean: Whether the " | tempo.co" suffix was already removed
         
     Returns:
         Sanitized filename without extension
     """
     # Remove " | tempo.co" suffix if present
-    if " | tempo.co" in title:
-        title = title.split(" | tempo.co")[0]
+    if not is_clean:
+        title = clean_title(title)
     
-    # Keep alphanumeric characters, spaces, and some punctuation
-    # Replace other characters with spaces
-    filename = re.sub(r'[^a-zA-Z0-9\s\-_.]', ' ', title)
+    # Keep alphanumeric characters and dots, replace everything else with hyphens
+    filename = title.encode('ascii', 'replace').decode('ascii').translate(_FN_TRANS)
     
-    # Replace multiple spaces/hyphens with single hyphen
-    filename = re.sub(r'[\s\-_]+', '-', filename)
+    # Collapse runs of hyphens into a single hyphen
+    filename = _DASH_RUN.sub('-', filename)
     
     # Remove leading/trailing hyphens
     filename = filename.strip('-')
@@ -54,17 +88,19 @@ def sanitize_filename(title: str) -> str:
     return filename.lower()
 
 
-def format_metadata(article: Dict[str, Any]) -> str:
+def format_metadata(article: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> str:
     """
     Format article metadata in simplified key-value format.
     
     Args:
         article: Article data dictionary
+        metadata: Article metadata dictionary, looked up from article if not given
         
     Returns:
         Formatted metadata string
     """
-    metadata = article.get("metadata", {})
+    if metadata is None:
+        metadata = article.get("metadata") or {}
     
     # Extract metadata fields
     category = metadata.get("category", "")
@@ -86,22 +122,13 @@ def format_metadata(article: Dict[str, Any]) -> str:
     else:
         published_at = ""
     
-    # Format tags with #free or #premium first
-    tag_list = []
-    if is_free:
-        tag_list.append("#free")
-    else:
-        tag_list.append("#premium")
-    
-    # Add article tags
-    for tag in tags:
-        # Clean and validate tag
-        if isinstance(tag, str) and tag.strip():
-            # Remove any non-alphanumeric characters except hyphens and underscores
-            clean_tag = re.sub(r'[^a-zA-Z0-9_-]', '', tag)
-            # Ensure it's not empty after cleaning
-            if clean_tag:
-                tag_list.append(f"#{clean_tag}")
+    # Format tags with #free or #premium first, followed by the article tags
+    # with any non-alphanumeric characters except hyphens and underscores removed
+    tag_list = [
+        "#free" if is_free else "#premium",
+        *("#" + clean_tag for tag in tags
+          if isinstance(tag, str) and (clean_tag := _TAG_STRIP.sub('', tag)))
+    ]
     
     tags_str = " ".join(tag_list)
     
@@ -116,65 +143,109 @@ def format_metadata(article: Dict[str, Any]) -> str:
     return "\n".join(metadata_lines)
 
 
-def create_markdown_content(article: Dict[str, Any]) -> str:
+def write_markdown(
+    article: Dict[str, Any],
+    fp: TextIO,
+    metadata: Optional[Dict[str, Any]] = None,
+    title: Optional[str] = None
+) -> None:
+    """
+    Write complete Markdown content for an article to an open file.
+    
+    The content is written piece by piece, so no intermediate copy of the
+    whole document is built in memory.
+    
+    Args:
+        article: Article data dictionary
+        fp: Text file object to write to
+        metadata: Article metadata dictionary, looked up from article if not given
+        title: Already cleaned title, extracted from metadata if not given
+    """
+    if metadata is None:
+        metadata = article.get("metadata") or {}
+    
+    # Extract title and clean it
+    if title is None:
+        title = clean_title(metadata.get("title", "Untitled Article"))
+    
+    # Metadata, blank line, then the title
+    fp.write(format_metadata(article, metadata))
+    fp.write("\n\n# ")
+    fp.write(title)
+    fp.write("\n")
+    
+    # Add content paragraphs as separate lines (one paragraph per line),
+    # each preceded by a blank line
+    for paragraph in article.get("content", []):
+        text = paragraph.strip()
+        if text:  # Only add non-empty paragraphs
+            fp.write("\n")
+            fp.write(text)
+            fp.write("\n")
+
+
+def create_markdown_content(article: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> str:
     """
     Create complete Markdown content for an article.
     
     Args:
         article: Article data dictionary
+        metadata: Article metadata dictionary, looked up from article if not given
         
     Returns:
         Complete Markdown content with proper line breaks
     """
-    metadata = format_metadata(article)
+    buffer = io.StringIO()
+    write_markdown(article, buffer, metadata)
+    return buffer.getvalue()
+
+
+def write_markdown_file(
+    md_file_path: Path,
+    article: Dict[str, Any],
+    metadata: Dict[str, Any],
+    title: str
+) -> None:
+    """
+    Stream an article's Markdown content straight into a new file.
     
-    # Extract title and clean it
-    title = article.get("metadata", {}).get("title", "Untitled Article")
-    if " | tempo.co" in title:
-        clean_title = title.split(" | tempo.co")[0]
-    else:
-        clean_title = title
-    
-    # Get content paragraphs
-    content_paragraphs = article.get("content", [])
-    
-    # Build Markdown content as a list of lines
-    md_content = []
-    md_content.append(metadata)
-    md_content.append("")  # Blank line after metadata
-    md_content.append(f"# {clean_title}")
-    md_content.append("")  # Blank line after title
-    
-    # Add content paragraphs as separate lines (one paragraph per line)
-    for paragraph in content_paragraphs:
-        if paragraph.strip():  # Only add non-empty paragraphs
-            md_content.append(paragraph.strip())
-            md_content.append("")  # Add blank line after each paragraph
-    
-    # Join all lines with actual newlines (not \n characters)
-    return "\n".join(md_content)
+    Args:
+        md_file_path: Path of the Markdown file to create
+        article: Article data dictionary
+        metadata: Article metadata dictionary
+        title: Cleaned article title
+    """
+    with open(md_file_path, 'w', encoding='utf-8') as f:
+        write_markdown(article, f, metadata, title)
 
 
-def process_json_file(json_file_path: Path, output_dir: Path) -> int:
+def process_json_file(json_file_path: Path, output_dir: Path) -> Tuple[int, List[str]]:
     """
     Process a single JSON file and convert articles to Markdown.
     
+    Messages are returned instead of printed, so output from files that
+    are converted in parallel cannot interleave.
+    
     Args:
         json_file_path: Path to JSON file
         output_dir: Output directory for Markdown files
         
     Returns:
-        Number of articles processed
+        Tuple of (number of articles processed, messages to print)
     """
+    messages = []
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Read the whole file in one call; both parsers accept UTF-8 bytes
+        raw = json_file_path.read_bytes()
+        if json_file_path.suffix == ".gz":
+            raw = gzip.decompress(raw)
+        data = orjson.loads(raw) if orjson else json.loads(raw)
     except Exception as e:
-        print(f"Error reading {json_file_path}: {e}")
-        return 0
+        messages.append(f"Error reading {json_file_path}: {e}")
+        return 0, messages
     
-    # Get category name from filename (without .json extension)
-    category = json_file_path.stem
+    # Get category name from filename (without .json or .json.gz extension)
+    category = category_of(json_file_path)
     
     # Create category directory
     category_dir = output_dir / category
@@ -184,43 +255,93 @@ def process_json_file(json_file_path: Path, output_dir: Path) -> int:
     articles = data.get(category, [])
     
     if not isinstance(articles, list):
-        print(f"Warning: Expected list of articles in {category}, got {type(articles)}")
-        return 0
-    
+        messages.append(f"Warning: Expected list of articles in {category}, got {type(articles)}")
+        return 0, messages
+    
+    # Snapshot existing file names once and resolve duplicates in memory.
+    # Rendering and writing are handed off to a small thread pool, so
+    # pending writes are not visible on disk yet anyway.
+    pending = []
+    used = {p.name for p in category_dir.iterdir()}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for i, article in enumerate(articles):
+            try:
+                metadata = article.get("metadata") or {}
+                
+                # Clean the title once for both the heading and the filename
+                title = metadata.get("title")
+                if title is None:
+                    heading = "Untitled Article"
+                    filename_title = f"article-{i}"
+                else:
+                    heading = filename_title = clean_title(title)
+                
+                # Generate filename
+                filename = sanitize_filename(filename_title, is_clean=True) + ".md"
+                
+                # Handle duplicate filenames
+                counter = 1
+                original_filename = filename
+                while filename in used:
+                    # Extract name without extension
+                    name_without_ext = original_filename[:-3]  # Remove .md
+                    # Create new filename with counter
+                    filename = f"{name_without_ext}-{counter}.md"
+                    counter += 1
+                used.add(filename)
+                md_file_path = category_dir / filename
+                
+                # Render and write the Markdown file in a worker thread
+                future = executor.submit(write_markdown_file, md_file_path, article, metadata, heading)
+                pending.append((i, md_file_path, future))
+                
+            except Exception as e:
+                messages.append(f"  Error processing article {i} in {category}: {e}")
+                continue
+    
+    # Report the files in article order once all writes are done
     article_count = 0
-    for i, article in enumerate(articles):
+    for i, md_file_path, future in pending:
         try:
-            # Create Markdown content
-            md_content = create_markdown_content(article)
-            
-            # Generate filename
-            title = article.get("metadata", {}).get("title", f"article-{i}")
-            filename = sanitize_filename(title) + ".md"
-            
-            # Handle duplicate filenames
-            md_file_path = category_dir / filename
-            counter = 1
-            original_filename = filename
-            while md_file_path.exists():
-                # Extract name without extension
-                name_without_ext = original_filename[:-3]  # Remove .md
-                # Create new filename with counter
-                filename = f"{name_without_ext}-{counter}.md"
-                md_file_path = category_dir / filename
-                counter += 1
-            
-            # Write to file
-            with open(md_file_path, 'w', encoding='utf-8') as f:
-                f.write(md_content)
-            
-            article_count += 1
-            print(f"  Created: {md_file_path.name}")
-            
+            future.result()
         except Exception as e:
-            print(f"  Error processing article {i} in {category}: {e}")
+            messages.append(f"  Error processing article {i} in {category}: {e}")
             continue
+        article_count += 1
+        messages.append(f"  Created: {md_file_path.name}")
+    
+    return article_count, messages
+
+
+def category_of(json_file_path: Path) -> str:
+    """
+    Get the category of a category file from its name.
+    
+    Args:
+        json_file_path: Path to a .json or .json.gz file
+        
+    Returns:
+        File name without the .json or .json.gz extension
+    """
+    return json_file_path.name.removesuffix(".gz").removesuffix(".json")
+
+
+def process_category_files(json_files: List[Path], output_dir: Path) -> List[Tuple[str, int, List[str]]]:
+    """
+    Process the JSON files of one category, one after another.
+    
+    Files of the same category write into the same directory, so they are
+    converted in order by a single worker and each one sees the file names
+    created by the ones before it.
     
-    return article_count
+    Args:
+        json_files: Paths to the JSON files of the category
+        output_dir: Output directory for Markdown files
+        
+    Returns:
+        List of (JSON file name, number of articles processed, messages to print)
+    """
+    return [(json_file.name, *process_json_file(json_file, output_dir)) for json_file in json_files]
 
 
 def main():
@@ -256,21 +377,34 @@ def main():
     print(f"Output directory: {output_dir}")
     print()
     
-    # Process all JSON files except metadata.json
-    json_files = list(input_dir.glob("*.json"))
-    json_files = [f for f in json_files if f.name != "metadata.json"]
+    # Process all JSON files, plain or gzip-compressed, except the metadata
+    json_files = [*input_dir.glob("*.json"), *input_dir.glob("*.json.gz")]
+    json_files = [f for f in json_files if f.name not in ("metadata.json", "metadata.json.gz")]
     
     if not json_files:
         print("No JSON files found to process (excluding metadata.json)")
         return
     
-    total_articles = 0
+    # Group the files by category; a category can have both a plain and a
+    # compressed file, and those must not write into its directory at once
+    categories: Dict[str, List[Path]] = {}
     for json_file in json_files:
-        print(f"Processing {json_file.name}...")
-        article_count = process_json_file(json_file, output_dir)
-        total_articles += article_count
-        print(f"  Converted {article_count} articles")
-        print()
+        categories.setdefault(category_of(json_file), []).append(json_file)
+    
+    # Each category maps to its own directory, so categories can be converted
+    # in parallel without filename collisions between workers. Only this
+    # process prints, in file order, so the output never interleaves.
+    total_articles = 0
+    max_workers = min(os.cpu_count() or 1, len(categories))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(partial(process_category_files, output_dir=output_dir), categories.values())
+        for name, article_count, messages in chain.from_iterable(results):
+            print(f"Processing {name}...")
+            for message in messages:
+                print(message)
+            total_articles += article_count
+            print(f"  Converted {article_count} articles")
+            print()
     
     print(f"Conversion complete!")
     print(f"Total articles converted: {total_articles}")
@@ -1,10 +1,22 @@
 """Configuration module for Tempo.co scraper."""
 
 from typing import Dict, Any
+import multiprocessing
 import os
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
+# Load environment variables from .env file; load_dotenv skips a missing
+# file itself, so there is no separate existence check
 dotenv_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', '.env')
-if os.path.exists(dotenv_path):
-    load_dotenv(dotenv_path)
\ No newline at end of file
+load_dotenv(dotenv_path)
+
+# Start method of every worker process pool. The pools run next to thread
+# pools, and forking a multi-threaded process can deadlock, so workers come
+# from a forkserver (or spawn, where that is missing)
+PROCESS_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Maximum number of requests in flight at once, shared by the index page and
+# article fetches so neither puts more load on the site than the other
+MAX_CONCURRENT_REQUESTS = 4
@@ -18,10 +18,16 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'             # Reset to default color
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Build the colored level names once instead of on every log call
+        self._colored_levelnames = {
+            level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()
+        }
+
     def format(self, record):
         # Add color to the log level
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
+        record.levelname = self._colored_levelnames.get(record.levelname, record.levelname)
         
         # Add color to the message if needed (optional)
         # You can add more sophisticated coloring here if desired
@@ -33,6 +39,8 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
     Set up a logger with console handler and colored output.
     
+    Colors are only used when stdout is a terminal.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -49,10 +57,14 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(level)
         
-        # Create colored formatter
-        formatter = ColoredFormatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
-        )
+        # Only color the output when writing to a terminal, so redirected
+        # logs skip the ANSI wrapping and stay free of escape codes
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        use_color = hasattr(handler.stream, 'isatty') and handler.stream.isatty()
+        if use_color:
+            formatter = ColoredFormatter(log_format)
+        else:
+            formatter = logging.Formatter(log_format)
         handler.setFormatter(formatter)
         
         # Add handler to logger
@@ -0,0 +1,62 @@
+"""Rate limiting for Tempo.co scraper."""
+
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how often requests are sent.
+    
+    Up to burst requests may start immediately; after that, requests are
+    spaced out to the configured rate. Only the time a worker actually has
+    to wait is slept, so slow responses count towards the delay instead of
+    adding to it.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Maximum sustained number of requests per second
+            burst: Number of requests allowed to start back to back
+            clock: Monotonic clock returning seconds (default: time.monotonic)
+            sleep: Function sleeping for a number of seconds (default: time.sleep)
+        """
+        self.interval = 1.0 / rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the next request is allowed to start."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+            self._updated = now
+            
+            # Reserve a token; a negative balance is the queue of workers
+            # waiting ahead, so each one sleeps until its own slot
+            self._tokens -= 1
+            wait = -self._tokens * self.interval
+        
+        if wait > 0:
+            self._sleep(wait)
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
@@ -54,4 +54,7 @@ HEADERS = {
 }
 
 # Base URL
-BASE_URL = "https://tempo.co/indeks"
\ No newline at end of file
+BASE_URL = "https://tempo.co/indeks"
+
+# Site root that relative article links are resolved against
+ARTICLE_BASE_URL = "https://www.tempo.co"
\ No newline at end of file
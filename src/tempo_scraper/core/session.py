@@ -1,34 +1,71 @@
 """Session management for Tempo.co scraper."""
 
+import functools
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from .logging import logger
+from .selectors import HEADERS
+
+# Define retry strategy
+# This will retry on 429, 500, 502, 503, 504 status codes
+# with exponential backoff
+RETRY_STRATEGY = Retry(
+    total=3,  # Total number of retries
+    status_forcelist=[429, 500, 502, 503, 504],  # Status codes to retry on
+    allowed_methods=frozenset(['GET', 'HEAD']),  # Only retry idempotent reads
+    backoff_factor=1,  # Backoff factor for exponential backoff
+    raise_on_status=False  # Don't raise exception on status, let the caller handle it
+)
+
+# Size of each session's connection pool, large enough to keep connections
+# alive for concurrent fetches
+POOL_SIZE = 20
+
+def create_adapter() -> HTTPAdapter:
+    """
+    Create a transport adapter with the shared retry strategy.
+    
+    Every session gets its own adapter, so closing one session never closes
+    the connection pool of another; only the retry strategy is shared.
+    
+    Returns:
+        Adapter with retry strategy and connection pool
+    """
+    return HTTPAdapter(
+        max_retries=RETRY_STRATEGY,
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE
+    )
 
 def create_session() -> requests.Session:
     """
-    Create a requests session with retry strategy.
+    Create a requests session with retry strategy and default headers.
     
     Returns:
         Configured requests session
     """
     session = requests.Session()
     
-    # Define retry strategy
-    # This will retry on 429, 500, 502, 503, 504 status codes
-    # with exponential backoff
-    retry_strategy = Retry(
-        total=3,  # Total number of retries
-        status_forcelist=[429, 500, 502, 503, 504],  # Status codes to retry on
-        backoff_factor=1,  # Backoff factor for exponential backoff
-        raise_on_status=False  # Don't raise exception on status, let the caller handle it
-    )
-    
-    # Create adapter with retry strategy
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    # Send the scraper headers with every request made through this session
+    session.headers.update(HEADERS)
     
-    # Mount adapter for both HTTP and HTTPS
+    # Mount one adapter for both HTTP and HTTPS
+    adapter = create_adapter()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     
-    return session
\ No newline at end of file
+    return session
+
+@functools.lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Get the shared requests session, creating it on first use.
+    
+    Reusing one session keeps connections alive across requests instead of
+    repeating the TCP and TLS handshakes for every page.
+    
+    Returns:
+        Shared requests session with retry strategy
+    """
+    return create_session()
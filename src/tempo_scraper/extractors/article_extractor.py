@@ -1,21 +1,37 @@
 """Article extraction module for Tempo.co scraper."""
 
+import functools
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 from typing import Optional, Dict, List
 from urllib.parse import urljoin, urlparse
-from ..core.session import create_session
+from ..core.session import get_session
+from ..core.rate_limiter import RateLimiter
 from ..core.logging import logger
-from ..core.selectors import ARTICLE_SELECTORS, HEADERS
+from ..core.selectors import ARTICLE_SELECTORS
 from ..models.article import Article, ArticleMetadata
 from ..utils.date_parser import parse_publication_datetime
 
-def extract_article_content(url: str) -> Optional[Article]:
+# CSS selectors compiled once from the configured selectors, so pages only
+# pay for matching and never for parsing the selector text
+ARTICLE_CONTAINER_SELECTOR = soupsieve.compile(
+    "article." + ".".join(ARTICLE_SELECTORS["article_container"].split())
+)
+PUBLISHED_TIME_SELECTOR = soupsieve.compile(f'meta[property="{ARTICLE_SELECTORS["published_time_meta"]}"]')
+PUBLISH_DATE_SELECTOR = soupsieve.compile(f'meta[name="{ARTICLE_SELECTORS["publish_date_meta"]}"]')
+AUTHOR_SELECTOR = soupsieve.compile(f'meta[name="{ARTICLE_SELECTORS["author_meta"]}"]')
+CONTENT_PARAGRAPH_SELECTOR = soupsieve.compile(
+    f'div#{ARTICLE_SELECTORS["content_wrapper"]} {ARTICLE_SELECTORS["content_paragraph"]}'
+)
+
+def extract_article_content(url: str, rate_limiter: Optional[RateLimiter] = None) -> Optional[Article]:
     """
     Extract article content from a Tempo.co article page.
     
     Args:
         url: URL of the article to extract
+        rate_limiter: Limiter to wait on before sending the request (default: None)
         
     Returns:
         Article object with extracted content, or None if extraction fails
@@ -23,11 +39,15 @@ def extract_article_content(url: str) -> Optional[Article]:
     logger.info(f"Fetching URL: {url}")
     
     try:
-        # Create session
-        session = create_session()
+        # Reuse the shared session
+        session = get_session()
+        
+        # Wait for our turn if requests are being rate limited
+        if rate_limiter is not None:
+            rate_limiter.acquire()
         
-        # Send GET request with headers
-        response = session.get(url, headers=HEADERS)
+        # Send GET request (the session already carries the scraper headers)
+        response = session.get(url)
         
         # Check for 429 status code
         if response.status_code == 429:
@@ -37,11 +57,12 @@ def extract_article_content(url: str) -> Optional[Article]:
         
         response.raise_for_status()
         
-        # Parse HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parse the raw bytes with the C-based lxml parser, which detects the
+        # encoding itself instead of going through response.text first
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Find the article element
-        article_element = soup.find('article', class_=ARTICLE_SELECTORS["article_container"])
+        article_element = ARTICLE_CONTAINER_SELECTOR.select_one(soup)
         
         if not article_element:
             logger.warning("Article element not found")
@@ -55,15 +76,13 @@ def extract_article_content(url: str) -> Optional[Article]:
         
         # Extract publication date
         pub_date = ""
-        published_meta = soup.find('meta', property=ARTICLE_SELECTORS["published_time_meta"])
-        publish_date_meta = soup.find('meta', attrs={'name': ARTICLE_SELECTORS["publish_date_meta"]})
-        date_meta = published_meta or publish_date_meta
+        date_meta = PUBLISHED_TIME_SELECTOR.select_one(soup) or PUBLISH_DATE_SELECTOR.select_one(soup)
         if date_meta and date_meta.get('content'):
             pub_date = date_meta.get('content')
         
         # Extract author
         author = ""
-        author_meta = soup.find('meta', attrs={'name': 'author'})
+        author_meta = AUTHOR_SELECTOR.select_one(soup)
         if author_meta and author_meta.get('content'):
             author = author_meta.get('content')
         
@@ -71,15 +90,12 @@ def extract_article_content(url: str) -> Optional[Article]:
         category = extract_category_from_url(url)
         
         # Extract article body content
-        content_paragraphs = []
-        content_wrappers = article_element.find_all('div', id=ARTICLE_SELECTORS["content_wrapper"])
-        for wrapper in content_wrappers:
-            paragraphs = wrapper.find_all(ARTICLE_SELECTORS["content_paragraph"])
-            for p in paragraphs:
-                # Skip empty paragraphs and editor picks
-                text = p.get_text().strip()
-                if text and not text.startswith(ARTICLE_SELECTORS["editor_pick_indicator"]):
-                    content_paragraphs.append(text)
+        # Skip empty paragraphs and editor picks
+        editor_pick = ARTICLE_SELECTORS["editor_pick_indicator"]
+        content_paragraphs = [
+            text for p in CONTENT_PARAGRAPH_SELECTOR.select(article_element)
+            if (text := p.get_text().strip()) and not text.startswith(editor_pick)
+        ]
         
         # Extract tags
         tags = []
@@ -125,6 +141,9 @@ def extract_article_content(url: str) -> Optional[Article]:
         logger.error(f"Error parsing HTML: {e}")
         return None
 
+# Each article URL is categorized both on the index page and again when its
+# content is extracted, so remember recent answers
+@functools.lru_cache(maxsize=1024)
 def extract_category_from_url(url: str) -> str:
     """
     Extract category from URL path.
@@ -135,13 +154,24 @@ def extract_category_from_url(url: str) -> str:
     Returns:
         Category name
     """
-    # Handle relative URLs by adding a base
-    if url.startswith('/'):
-        url = 'https://tempo.co' + url
+    if '?' in url or '#' in url or ';' in url:
+        path = None
+    elif url.startswith('/'):
+        # Relative URL, already a path
+        path = url
+    elif url.startswith(('https://', 'http://')):
+        # Absolute URL, drop the scheme and host
+        host_end = url.find('/', url.find('//') + 2)
+        path = url[host_end:] if host_end != -1 else ''
+    else:
+        path = None
     
-    parsed_url = urlparse(url)
-    path_parts = parsed_url.path.strip('/').split('/')
-    if path_parts and path_parts[0]:
-        return path_parts[0]
-    return "indeks"  # Default category if none found
-
+    # Fall back to full URL parsing for anything unusual
+    if path is None:
+        # Handle relative URLs by adding a base
+        if url.startswith('/'):
+            url = 'https://tempo.co' + url
+        path = urlparse(url).path
+    
+    category = path.strip('/').split('/', 1)[0]
+    return category or "indeks"  # Default category if none found
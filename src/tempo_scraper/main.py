@@ -1,23 +1,27 @@
 """Main module for Tempo.co scraper."""
 
 import argparse
+import functools
 import sys
-import time
 import os
+from itertools import chain
 from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from .scrapers.index_scraper import scrape_index_page
+from .scrapers.index_scraper import scrape_index_pages_concurrently
 from .scrapers.article_filters import filter_articles_by_access, extract_content_for_articles
 from .extractors.article_extractor import extract_article_content
 from .utils.url_builder import build_index_url
-from .utils.validators import validate_date_format, validate_date_range, validate_page_range, process_dates
-from .utils.file_handler import save_articles_to_json
+from .utils.validators import concurrency_error, date_format_error, output_format_error, page_range_error, validate_date_range, process_dates
+from .utils.file_handler import save_articles_to_json, save_articles_to_ndjson
+from .utils.page_cache import PAGE_CACHE_FILENAME, IndexPageCache
 from .models.article import Article, ArticleMetadata, ScrapingOptions
 from .core.logging import logger
+from .core.rate_limiter import RateLimiter
+from .core.config import MAX_CONCURRENT_REQUESTS
 
 def scrape_index_pages(options: ScrapingOptions) -> str:
     """
@@ -36,62 +40,60 @@ def scrape_index_pages(options: ScrapingOptions) -> str:
     if not validate_date_range(options.start_date, options.end_date):
         sys.exit(1)
     
-    # Collect all articles
-    all_articles = []
+    # Build the page URLs and fetch the pages concurrently, stopping at the
+    # first page that comes back short
+    pages = list(range(options.start_page, options.end_page + 1))
+    page_requests = [
+        (build_index_url(page, options.start_date, options.end_date, options.rubric), page)
+        for page in pages
+    ]
+    # Space the requests out to one per delay, allowing a short burst so the
+    # concurrent workers can start together; the index pages and the article
+    # fetches share the one limiter
+    rate_limiter = RateLimiter(rate=1 / options.delay, burst=4) if options.delay > 0 else None
     
-    for page in range(options.start_page, options.end_page + 1):
-        # Construct URL
-        url = build_index_url(page, options.start_date, options.end_date, options.rubric)
-        
-        # Scrape the page
-        articles = scrape_index_page(url, page, options.article_per_page)
-        
-        # Check if we should stop scraping (if less than expected articles found)
-        if len(articles) < options.article_per_page:
-            logger.info(f"Found only {len(articles)} articles on page {page}, which is less than the expected {options.article_per_page}. Stopping scraping.")
-            # Add the articles from this page to the collection
-            filtered_articles = filter_articles_by_access(articles)
-            
-            # If extract_content is True, extract full content for each article
-            if options.extract_content:
-                articles_with_content = extract_content_for_articles(filtered_articles)
-                all_articles.extend(articles_with_content)
-            else:
-                # Convert ArticleMetadata to Article objects (without content)
-                articles_as_objects = [
-                    Article(
-                        metadata=meta,
-                        content=[],
-                        tags=[]
-                    ) for meta in filtered_articles
-                ]
-                all_articles.extend(articles_as_objects)
-            
-            # Break the loop as we've found fewer articles than expected
-            break
-        
+    # Remember page validators across runs so unchanged pages are not
+    # downloaded and parsed again; the cache lives in the output directory
+    # unless another file is given
+    page_cache = None
+    if options.use_page_cache:
+        page_cache = IndexPageCache.load(
+            options.page_cache or os.path.join(options.output_dir, PAGE_CACHE_FILENAME)
+        )
+    page_results = scrape_index_pages_concurrently(
+        page_requests, options.article_per_page, options.max_concurrency,
+        rate_limiter=rate_limiter, page_cache=page_cache
+    )
+    if page_cache is not None:
+        page_cache.save()
+    
+    # Collect the filtered articles of each page, in page order; the results
+    # end at the first short page, so later pages are never requested
+    page_articles = []
+    
+    for page, articles in zip(pages, page_results):
         # Filter articles based on access rights
-        filtered_articles = filter_articles_by_access(articles)
-        
-        # If extract_content is True, extract full content for each article
-        if options.extract_content:
-            articles_with_content = extract_content_for_articles(filtered_articles)
-            all_articles.extend(articles_with_content)
-        else:
-            # Convert ArticleMetadata to Article objects (without content)
-            articles_as_objects = [
-                Article(
-                    metadata=meta,
-                    content=[],
-                    tags=[]
-                ) for meta in filtered_articles
-            ]
-            all_articles.extend(articles_as_objects)
-        
-        # Add delay between requests (except for the last page)
-        if page < options.end_page:
-            logger.info(f"Waiting {options.delay} seconds before next request...")
-            time.sleep(options.delay)
+        page_articles.append(filter_articles_by_access(articles))
+    
+    # Report where the scrape stopped if it ended before end_page
+    if len(articles) < options.article_per_page and page < options.end_page:
+        logger.info(f"Found only {len(articles)} articles on page {page}, which is less than the expected {options.article_per_page}. Stopped after page {page}.")
+    
+    # Flatten the pages into one list in a single pass
+    filtered_articles = list(chain.from_iterable(page_articles))
+    
+    # If extract_content is True, extract full content for each article
+    if options.extract_content:
+        all_articles = extract_content_for_articles(filtered_articles, options.max_concurrency, rate_limiter)
+    else:
+        # Convert ArticleMetadata to Article objects (without content)
+        all_articles = [
+            Article(
+                metadata=meta,
+                content=[],
+                tags=[]
+            ) for meta in filtered_articles
+        ]
     
     # Prepare scraping options for metadata
     scraping_options = {
@@ -105,26 +107,46 @@ def scrape_index_pages(options: ScrapingOptions) -> str:
         "categorize": options.categorize
     }
     
+    output_dir = options.output_dir
+    
+    # Stream articles to a JSON lines file, one article per line
+    if options.stream and not options.categorize:
+        return save_articles_to_ndjson(
+            all_articles,
+            output_dir,
+            scraping_options=scraping_options,
+            output_filename=options.output_name,
+            compress=options.compress
+        )
+    
     # Save articles to JSON file
-    output_dir = "data/output"
     output_file = save_articles_to_json(
         all_articles, 
         output_dir, 
         is_index_scraping=True,
         scraping_options=scraping_options,
         categorize=options.categorize,
-        output_filename=options.output_name
+        output_filename=options.output_name,
+        pretty=options.pretty,
+        compress=options.compress
     )
     
     return output_file
 
-def extract_single_article(url: str, output_name: Optional[str] = None) -> str:
+def extract_single_article(
+    url: str,
+    output_name: Optional[str] = None,
+    pretty: bool = False,
+    output_dir: str = "data/output"
+) -> str:
     """
     Extract content from a single article.
     
     Args:
         url: URL of the article to extract
         output_name: Custom output name (without extension) (default: None)
+        pretty: Whether to indent the JSON output (default: False)
+        output_dir: Directory to save the output to (default: data/output)
         
     Returns:
         Path to the saved output file
@@ -137,18 +159,27 @@ def extract_single_article(url: str, output_name: Optional[str] = None) -> str:
         sys.exit(1)
     
     # Save to JSON file
-    output_dir = "data/output"
     output_file = save_articles_to_json(
         [article], 
         output_dir, 
         is_index_scraping=False,
-        output_filename=output_name
+        output_filename=output_name,
+        pretty=pretty
     )
     
     return output_file
 
-def main():
-    """Main entry point for the scraper."""
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser for the scraper.
+    
+    The parser is built on the first call and shared afterwards; parsing
+    does not modify it.
+    
+    Returns:
+        Parser with the indeks and article subcommands
+    """
     parser = argparse.ArgumentParser(description="Tempo.co Scraper")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -158,7 +189,8 @@ def main():
     # Add arguments for index scraper
     index_parser.add_argument("--start-page", type=int, default=1, help="Starting page number (default: 1)")
     index_parser.add_argument("--end-page", type=int, default=3, help="Ending page number (default: 3)")
-    index_parser.add_argument("--delay", type=int, default=1, help="Delay between requests in seconds (default: 1)")
+    index_parser.add_argument("--delay", type=int, default=1, help="Minimum delay between requests in seconds, after a burst of up to 4; 0 disables the limit (default: 1)")
+    index_parser.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENT_REQUESTS, help=f"Maximum number of requests in flight at once (default: {MAX_CONCURRENT_REQUESTS})")
     index_parser.add_argument("--start-date", help="Start date in YYYY-MM-DD format (default: None)")
     index_parser.add_argument("--end-date", help="End date in YYYY-MM-DD format (default: None)")
     index_parser.add_argument("--article-per-page", type=int, default=20, help="Number of articles per page (default: 20)")
@@ -166,11 +198,25 @@ def main():
     index_parser.add_argument("--rubric", help="Rubric to filter by (default: None)")
     index_parser.add_argument("--categorize", action="store_true", help="Categorize articles by category (default: False)")
     index_parser.add_argument("--output-name", help="Custom output name (without extension) (default: auto-generated)")
+    index_parser.add_argument("--output-dir", default="data/output", help="Directory to save the output to (default: data/output)")
+    index_parser.add_argument("--stream", action="store_true", help="Write one article per line to a JSON lines file; not with --categorize or --pretty (default: False)")
+    index_parser.add_argument("--pretty", action="store_true", help="Indent the JSON output for readability (default: False)")
+    index_parser.add_argument("--compress", action="store_true", help="Gzip the output files, adding a .gz suffix (default: False)")
+    index_parser.add_argument("--page-cache", help="File to keep index page ETags and articles in (default: OUTPUT_DIR/.cache/etag.json)")
+    index_parser.add_argument("--no-page-cache", action="store_true", help="Fetch every index page in full without reading or writing the page cache (default: False)")
     
     # Subparser for article extractor
     article_parser = subparsers.add_parser('article', help='Extract content from a single article')
     article_parser.add_argument("--url", type=str, required=True, help="URL of the article to extract")
     article_parser.add_argument("--output-name", help="Custom output name (without extension) (default: auto-generated)")
+    article_parser.add_argument("--output-dir", default="data/output", help="Directory to save the output to (default: data/output)")
+    article_parser.add_argument("--pretty", action="store_true", help="Indent the JSON output for readability (default: False)")
+    
+    return parser
+
+def main():
+    """Main entry point for the scraper."""
+    parser = build_parser()
     
     # If no arguments provided, show help
     if len(sys.argv) == 1:
@@ -180,15 +226,19 @@ def main():
     args = parser.parse_args()
     
     if args.command == 'indeks':
-        # Validate date formats
-        if not validate_date_format(args.start_date, "start-date"):
-            sys.exit(1)
-        
-        if not validate_date_format(args.end_date, "end-date"):
-            sys.exit(1)
-        
-        # Validate page range
-        if not validate_page_range(args.start_page, args.end_page):
+        # Validate date formats, page range, concurrency and output options,
+        # reporting every problem at once
+        errors = [
+            error for error in (
+                date_format_error(args.start_date, "start-date"),
+                date_format_error(args.end_date, "end-date"),
+                page_range_error(args.start_page, args.end_page),
+                concurrency_error(args.max_concurrency),
+                output_format_error(args.stream, args.categorize, args.pretty)
+            ) if error
+        ]
+        if errors:
+            logger.error("\n".join(errors))
             sys.exit(1)
         
         # Create scraping options
@@ -196,13 +246,20 @@ def main():
             start_page=args.start_page,
             end_page=args.end_page,
             delay=args.delay,
+            max_concurrency=args.max_concurrency,
             start_date=args.start_date,
             end_date=args.end_date,
             article_per_page=args.article_per_page,
             extract_content=args.extract_content,
             rubric=args.rubric,
             categorize=args.categorize,
-            output_name=args.output_name
+            output_name=args.output_name,
+            output_dir=args.output_dir,
+            stream=args.stream,
+            pretty=args.pretty,
+            compress=args.compress,
+            page_cache=args.page_cache,
+            use_page_cache=not args.no_page_cache
         )
         
         # Run index scraper
@@ -211,7 +268,7 @@ def main():
         
     elif args.command == 'article':
         # Run article extractor
-        output_file = extract_single_article(args.url, args.output_name)
+        output_file = extract_single_article(args.url, args.output_name, args.pretty, args.output_dir)
         logger.info(f"Article extraction completed. Output saved to: {output_file}")
         
     else:
@@ -3,8 +3,9 @@
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from ..core.config import MAX_CONCURRENT_REQUESTS
 
-@dataclass
+@dataclass(slots=True)
 class ArticleMetadata:
     """Metadata for an article."""
     url: str
@@ -17,19 +18,20 @@ class ArticleMetadata:
     timezone: str = ""
     author: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Represents a complete article with content."""
     metadata: ArticleMetadata
     content: List[str]
     tags: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingOptions:
     """Options for scraping operations."""
     start_page: int = 1
     end_page: int = 3
     delay: int = 1
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS
     start_date: Optional[str] = None
     end_date: Optional[str] = None
     article_per_page: int = 20
@@ -37,8 +39,14 @@ class ScrapingOptions:
     rubric: Optional[str] = None
     categorize: bool = False
     output_name: Optional[str] = None
+    output_dir: str = "data/output"
+    stream: bool = False
+    pretty: bool = False
+    compress: bool = False
+    page_cache: Optional[str] = None
+    use_page_cache: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     """Result of a scraping operation."""
     articles: List[Article]
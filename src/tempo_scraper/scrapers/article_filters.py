@@ -1,9 +1,18 @@
 """Article filtering module for Tempo.co scraper."""
 
-from typing import List
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import List, Optional
 from ..models.article import ArticleMetadata, Article
 from ..extractors.article_extractor import extract_article_content
 from ..core.logging import logger
+from ..core.rate_limiter import RateLimiter
+from ..core.config import MAX_CONCURRENT_REQUESTS
+from ..utils.url_builder import build_article_url
+
+# Number of extracted articles between progress log messages
+PROGRESS_LOG_INTERVAL = 25
 
 def filter_articles_by_access(articles: List[ArticleMetadata]) -> List[ArticleMetadata]:
     """
@@ -19,53 +28,93 @@ def filter_articles_by_access(articles: List[ArticleMetadata]) -> List[ArticleMe
     # Only the article extractor should skip non-free articles
     return articles
 
-def extract_content_for_articles(articles: List[ArticleMetadata]) -> List[Article]:
+def extract_content_for_article(
+    article_meta: ArticleMetadata,
+    index: int,
+    total: int,
+    rate_limiter: Optional[RateLimiter] = None
+) -> Article:
+    """
+    Extract full content for a single article.
+    
+    Args:
+        article_meta: Article metadata
+        index: Position of the article in the batch (for logging)
+        total: Number of articles in the batch (for logging)
+        rate_limiter: Limiter to wait on before fetching the article (default: None)
+        
+    Returns:
+        Article with full content, or with a placeholder if content is unavailable
+    """
+    # Per-article messages are debug-only; progress is reported in batches
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"Extracting content for article {index}/{total}: {article_meta.url}")
+    
+    # Check if article is free (authentication is no longer supported)
+    if not article_meta.is_free:
+        # Non-free article without authentication
+        if debug:
+            logger.debug(f"  Article is not free and no authentication provided: {article_meta.url}")
+        # Create article with empty content and reason
+        return Article(
+            metadata=article_meta,
+            content=["[Content not available: Non-free article and no authentication provided]"],
+            tags=[]
+        )
+        
+    # Extract full content from the absolute article URL
+    article = extract_article_content(build_article_url(article_meta.url), rate_limiter)
+    if article:
+        return article
+    
+    # Failed to extract content (likely photo/video archive)
+    if debug:
+        logger.debug(f"  Failed to extract content (likely photo/video archive): {article_meta.url}")
+    # Create article with empty content and reason
+    return Article(
+        metadata=article_meta,
+        content=["[Content not available: Article structure not found (likely photo/video archive)]"],
+        tags=[]
+    )
+
+def extract_content_for_articles(
+    articles: List[ArticleMetadata],
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+    rate_limiter: Optional[RateLimiter] = None
+) -> List[Article]:
     """
     Extract full content for a list of articles.
     
+    Articles are fetched concurrently by a small pool of worker threads, so
+    the network wait of one request overlaps with the fetch and parse of
+    others while the load on the server stays bounded.
+    
     Args:
         articles: List of article metadata
+        max_workers: Maximum number of concurrent fetches (default: MAX_CONCURRENT_REQUESTS)
+        rate_limiter: Limiter shared by all article fetches (default: None)
         
     Returns:
-        List of articles with full content
+        List of articles with full content, in the same order as the input
     """
-    articles_with_content = []
+    if not articles:
+        return []
     
-    for i, article_meta in enumerate(articles, 1):
-        logger.info(f"Extracting content for article {i}/{len(articles)}: {article_meta.url}")
-        
-        # Convert relative URLs to absolute URLs
-        if article_meta.url.startswith('/'):
-            full_url = 'https://www.tempo.co' + article_meta.url
-        else:
-            full_url = article_meta.url
-            
-        # Check if article is free (authentication is no longer supported)
-        if not article_meta.is_free:
-            # Non-free article without authentication
-            logger.info(f"  Article is not free and no authentication provided: {article_meta.url}")
-            # Create article with empty content and reason
-            empty_article = Article(
-                metadata=article_meta,
-                content=["[Content not available: Non-free article and no authentication provided]"],
-                tags=[]
-            )
-            articles_with_content.append(empty_article)
-            continue
-            
-        # Extract full content
-        article = extract_article_content(full_url)
-        if article:
+    total = len(articles)
+    articles_with_content = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # executor.map preserves the input order
+        results = executor.map(
+            extract_content_for_article,
+            articles,
+            range(1, total + 1),
+            repeat(total),
+            repeat(rate_limiter)
+        )
+        for done, article in enumerate(results, 1):
             articles_with_content.append(article)
-        else:
-            # Failed to extract content (likely photo/video archive)
-            logger.info(f"  Failed to extract content (likely photo/video archive): {article_meta.url}")
-            # Create article with empty content and reason
-            empty_article = Article(
-                metadata=article_meta,
-                content=["[Content not available: Article structure not found (likely photo/video archive)]"],
-                tags=[]
-            )
-            articles_with_content.append(empty_article)
+            if done % PROGRESS_LOG_INTERVAL == 0 or done == total:
+                logger.info(f"Extracted {done}/{total} articles")
     
-    return articles_with_content
\ No newline at end of file
+    return articles_with_content
@@ -1,19 +1,121 @@
 """Index scraping module for Tempo.co scraper."""
 
-import time
+import multiprocessing
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any
-from urllib.parse import urlparse
-from ..core.session import create_session
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from lxml import etree
+from typing import List, Dict, Any, Optional, Tuple
+from ..core.config import MAX_CONCURRENT_REQUESTS, PROCESS_POOL_START_METHOD
+from ..core.session import get_session
+from ..core.rate_limiter import RateLimiter
 from ..core.logging import logger
-from ..core.selectors import INDEX_SELECTORS, HEADERS
+from ..core.selectors import INDEX_SELECTORS
+from ..extractors.article_extractor import extract_category_from_url
 from ..models.article import ArticleMetadata
+from ..utils.page_cache import IndexPageCache
+
+def has_classes_xpath(classes: str) -> str:
+    """
+    Build an XPath predicate matching elements that have all the given classes.
+    
+    Args:
+        classes: Space-separated class names
+        
+    Returns:
+        XPath predicate expression
+    """
+    return " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+        for cls in classes.split()
+    )
+
+# XPath expressions compiled once from the configured selectors
+CONTAINER_XPATH = etree.XPath(
+    f'(//div[{has_classes_xpath(INDEX_SELECTORS["article_list_container"])}])[1]'
+)
+ITEMS_XPATH = etree.XPath(f'./{INDEX_SELECTORS["article_item"]}')
+ARTICLE_LINK_XPATH = etree.XPath(
+    "(.//" + "//".join(
+        INDEX_SELECTORS[key] for key in (
+            "article_figure", "article_figcaption", "article_paragraph", "article_link"
+        )
+    ) + ")[1]"
+)
+PREMIUM_INDICATOR_XPATH = etree.XPath(
+    f'.//span[{has_classes_xpath(INDEX_SELECTORS["premium_indicator"])}]'
+)
+TEXT_XPATH = etree.XPath('.//text()')
+
+# Minimum number of pages for which parsing is moved to worker processes
+PROCESS_PARSE_MIN_PAGES = 8
+
+def parse_index_html(content: bytes, page_num: int, article_per_page: int = 20) -> List[ArticleMetadata]:
+    """
+    Parse the article metadata out of an index page.
+    
+    This is a top-level function taking and returning only picklable values,
+    so it can run in a worker process.
+    
+    Args:
+        content: Raw HTML of the index page
+        page_num: Page number (for logging)
+        article_per_page: Maximum number of articles to extract per page
+        
+    Returns:
+        List of article metadata
+    """
+    # Parse the raw bytes with lxml directly; no BeautifulSoup wrapper
+    # objects are created and the lookups below run as compiled XPath
+    root = etree.fromstring(content, etree.HTMLParser(encoding="utf-8"))
+    
+    # Find the div with class "flex flex-col divide-y divide-neutral-500"
+    containers = CONTAINER_XPATH(root) if root is not None else []
+    
+    articles = []
+    
+    if containers:
+        # Find all child divs
+        child_divs = ITEMS_XPATH(containers[0])
+        
+        # Limit the number of articles based on article_per_page parameter
+        child_divs = child_divs[:article_per_page]
+        
+        # Extract href and text from each div > figure > figcaption > p > a
+        for child_div in child_divs:
+            links = ARTICLE_LINK_XPATH(child_div)
+            if links and links[0].get('href'):
+                link = links[0]
+                href = link.get('href')
+                title = "".join(text.strip() for text in TEXT_XPATH(link))
+                
+                # Extract category from the URL
+                category = extract_category_from_url(href)
+                
+                # Check if the article is free or not
+                is_free = is_article_free(link)
+                
+                articles.append(ArticleMetadata(
+                    url=href,
+                    title=title,
+                    category=category,
+                    is_free=is_free
+                ))
+        
+        logger.info(f"Page {page_num}: Found {len(articles)} articles (limited to {article_per_page} per page)")
+    else:
+        logger.warning(f"Page {page_num}: Div with class '{INDEX_SELECTORS['article_list_container']}' not found")
+    
+    return articles
 
 def scrape_index_page(
     url: str,
     page_num: int,
-    article_per_page: int = 20
+    article_per_page: int = 20,
+    session: Optional[requests.Session] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    parse_pool: Optional[Executor] = None,
+    page_cache: Optional[IndexPageCache] = None
 ) -> List[ArticleMetadata]:
     """
     Scrape a single index page and return article metadata.
@@ -22,6 +124,10 @@ def scrape_index_page(
         url: URL of the index page to scrape
         page_num: Page number (for logging)
         article_per_page: Maximum number of articles to extract per page
+        session: Session to fetch with (default: the shared session)
+        rate_limiter: Limiter to wait on before sending the request (default: None)
+        parse_pool: Executor to parse the page in (default: parse in this thread)
+        page_cache: Cache for conditional requests (default: None)
         
     Returns:
         List of article metadata
@@ -29,11 +135,33 @@ def scrape_index_page(
     logger.info(f"Fetching URL: {url}")
     
     try:
-        # Create session
-        session = create_session()
+        # Reuse the shared session so connections stay alive across pages
+        if session is None:
+            session = get_session()
+        
+        # Wait for our turn if requests are being rate limited
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        
+        # Send GET request (the session already carries the scraper headers),
+        # made conditional when the page was seen on an earlier run
+        if page_cache is not None:
+            response = session.get(url, headers=page_cache.request_headers(url, article_per_page))
+        else:
+            response = session.get(url)
         
-        # Send GET request
-        response = session.get(url, headers=HEADERS)
+        # The page has not changed since it was cached, so skip the download
+        # and the parse and reuse its articles
+        if response.status_code == 304 and page_cache is not None:
+            articles = page_cache.get_articles(url)
+            if articles is not None:
+                logger.info(f"Page {page_num}: Not modified, reusing {len(articles)} cached articles")
+                return articles
+            
+            # Nothing to reuse, so fetch the page in full instead of
+            # treating it as empty
+            logger.warning(f"Page {page_num}: Not modified but not cached, fetching it again")
+            response = session.get(url)
         
         # Check for 429 status code
         if response.status_code == 429:
@@ -43,50 +171,17 @@ def scrape_index_page(
         
         response.raise_for_status()
         
-        # Parse HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find the div with class "flex flex-col divide-y divide-neutral-500"
-        target_div = soup.find('div', class_=INDEX_SELECTORS["article_list_container"])
-        
-        articles = []
-        
-        if target_div:
-            # Find all child divs
-            child_divs = target_div.find_all(INDEX_SELECTORS["article_item"], recursive=False)
-            
-            # Limit the number of articles based on article_per_page parameter
-            child_divs = child_divs[:article_per_page]
-            
-            # Extract href and text from each div > figure > figcaption > p > a
-            for child_div in child_divs:
-                figure = child_div.find(INDEX_SELECTORS["article_figure"])
-                if figure:
-                    figcaption = figure.find(INDEX_SELECTORS["article_figcaption"])
-                    if figcaption:
-                        p = figcaption.find(INDEX_SELECTORS["article_paragraph"])
-                        if p:
-                            link = p.find(INDEX_SELECTORS["article_link"])
-                            if link and link.get('href'):
-                                href = link['href']
-                                title = link.get_text(strip=True).strip()
-                                
-                                # Extract category from the URL
-                                category = extract_category_from_url(href)
-                                
-                                # Check if the article is free or not
-                                is_free = is_article_free(link)
-                                
-                                articles.append(ArticleMetadata(
-                                    url=href,
-                                    title=title,
-                                    category=category,
-                                    is_free=is_free
-                                ))
-            
-            logger.info(f"Page {page_num}: Found {len(articles)} articles (limited to {article_per_page} per page)")
+        # Parse in a worker process when a pool is given; the page HTML goes
+        # in and plain article metadata comes back out
+        if parse_pool is not None:
+            articles = parse_pool.submit(
+                parse_index_html, response.content, page_num, article_per_page
+            ).result()
         else:
-            logger.warning(f"Page {page_num}: Div with class '{INDEX_SELECTORS['article_list_container']}' not found")
+            articles = parse_index_html(response.content, page_num, article_per_page)
+        
+        if page_cache is not None:
+            page_cache.store(url, response.headers, article_per_page, articles)
         
         return articles
     
@@ -97,27 +192,85 @@ def scrape_index_page(
         logger.error(f"Error parsing HTML for page {page_num}: {e}")
         return []
 
-def extract_category_from_url(url: str) -> str:
+def scrape_index_pages_concurrently(
+    pages: List[Tuple[str, int]],
+    article_per_page: int = 20,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    session: Optional[requests.Session] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    page_cache: Optional[IndexPageCache] = None
+) -> List[List[ArticleMetadata]]:
     """
-    Extract category from URL path.
+    Scrape several index pages concurrently.
+    
+    Page fetches are I/O-bound, so a small thread pool overlaps their
+    network round trips while bounding the load on the server. All pages
+    go through one session, so the workers share a single connection pool
+    and reuse its keep-alive connections instead of each doing DNS and
+    TLS setup. When there are enough pages, the HTML is parsed in a process
+    pool so parsing runs on several cores.
+    
+    Pages are fetched in windows of max_concurrency pages. The first page
+    with fewer than article_per_page articles is the last page of the
+    listing, so no further windows are requested once one is found.
     
     Args:
-        url: Article URL
+        pages: List of (URL, page number) pairs to scrape
+        article_per_page: Maximum number of articles to extract per page
+        max_concurrency: Maximum number of pages fetched at the same time (default: MAX_CONCURRENT_REQUESTS)
+        session: Session to fetch with (default: the shared session)
+        rate_limiter: Limiter shared by all page fetches (default: None)
+        page_cache: Cache for conditional requests (default: None)
         
     Returns:
-        Category name
+        List of article metadata lists, in the same order as pages, ending
+        with the first page that came back short
     """
-    # Handle relative URLs by adding a base
-    if url.startswith('/'):
-        url = 'https://tempo.co' + url
-    
-    parsed_url = urlparse(url)
-    path_parts = parsed_url.path.strip('/').split('/')
-    if path_parts and path_parts[0]:
-        return path_parts[0]
-    return "indeks"  # Default category if none found
+    if not pages:
+        return []
+    
+    if session is None:
+        session = get_session()
+    
+    workers = min(max_concurrency, len(pages))
+    
+    # Parsing is CPU-bound and holds the GIL, so for larger scrapes hand it to
+    # worker processes; for a few pages, starting them costs more than it saves
+    parse_pool = None
+    if len(pages) >= PROCESS_PARSE_MIN_PAGES:
+        parse_pool = ProcessPoolExecutor(
+            max_workers=min(workers, os.cpu_count() or 1),
+            # The workers start while the fetch threads run, so they are
+            # never forked
+            mp_context=multiprocessing.get_context(PROCESS_POOL_START_METHOD)
+        )
+    
+    results: List[List[ArticleMetadata]] = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(pages), workers):
+                window = pages[start:start + workers]
+                for (_, page_num), articles in zip(window, executor.map(
+                    lambda page: scrape_index_page(
+                        page[0], page[1], article_per_page, session,
+                        rate_limiter, parse_pool, page_cache
+                    ),
+                    window
+                )):
+                    results.append(articles)
+                    
+                    # A short page ends the listing; later pages of this
+                    # window were already fetched and are dropped
+                    if len(articles) < article_per_page:
+                        if start + workers < len(pages):
+                            logger.info(f"Page {page_num} is short, not requesting pages after {window[-1][1]}")
+                        return results
+        return results
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
 
-def is_article_free(link_element: BeautifulSoup) -> bool:
+def is_article_free(link_element: etree._Element) -> bool:
     """
     Check if an article is free based on its link element.
     
@@ -125,14 +278,12 @@ def is_article_free(link_element: BeautifulSoup) -> bool:
     If no premium indicators are found, the article is free.
     
     Args:
-        link_element: BeautifulSoup element of the article link
+        link_element: lxml element of the article link
         
     Returns:
         True if free, False if premium
     """
     # Look for span with class "inline-flex bg-primary-main p-[1.7px] rounded-[1.7px]"
-    span_tag = link_element.find('span', class_=INDEX_SELECTORS["premium_indicator"])
-    
     # If premium indicator is found, article is not free
     # If no premium indicator is found, article is free
-    return span_tag is None
\ No newline at end of file
+    return not PREMIUM_INDICATOR_XPATH(link_element)
\ No newline at end of file
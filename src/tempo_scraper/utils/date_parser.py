@@ -1,7 +1,42 @@
 """Date and time parsing utilities for Tempo.co scraper."""
 
+import functools
+import re
+from datetime import date, datetime
 from typing import Dict
 
+# Month names as they appear in publication dates, mapped to month numbers
+MONTHS = {
+    "January": 1, "February": 2, "March": 3, "April": 4,
+    "May": 5, "June": 6, "July": 7, "August": 8,
+    "September": 9, "October": 10, "November": 11, "December": 12
+}
+
+# Canonical YYYY-MM-DD date, with ASCII digits only
+YMD_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+
+@functools.lru_cache(maxsize=1024)
+def parse_ymd(date_str: str) -> date:
+    """
+    Parse a date string in YYYY-MM-DD format.
+    
+    Args:
+        date_str: Date string to parse
+        
+    Returns:
+        Parsed date
+        
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    # Match the canonical zero-padded form with one compiled regex and build
+    # the date from its groups; anything else goes through strptime, which
+    # also accepts unpadded months and days
+    match = YMD_PATTERN.fullmatch(date_str)
+    if match:
+        return date(*map(int, match.groups()))
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
 def parse_publication_datetime(pub_date_str: str) -> Dict[str, str]:
     """
     Parse publication date string and separate into date and time components.
@@ -21,37 +56,27 @@ def parse_publication_datetime(pub_date_str: str) -> Dict[str, str]:
         if len(parts) != 2:
             return {"date": "", "time": "", "timezone": ""}
         
-        date_part = parts[0].strip()
-        time_part = parts[1].strip()
+        date_part, time_part = parts
         
         # Parse date part (e.g., "12 September 2025")
-        months = {
-            "January": "01", "February": "02", "March": "03", "April": "04",
-            "May": "05", "June": "06", "July": "07", "August": "08",
-            "September": "09", "October": "10", "November": "11", "December": "12"
-        }
-        
         date_components = date_part.split()
         if len(date_components) == 3:
-            day = date_components[0].zfill(2)
-            month_name = date_components[1]
-            year = date_components[2]
-            
-            month = months.get(month_name, "01")
-            formatted_date = f"{year}-{month}-{day}"
+            day, month_name, year = date_components
+            month = MONTHS.get(month_name, 1)
+            # Pad as text, like the time below, so a malformed component
+            # cannot raise and discard the rest of the result
+            formatted_date = f"{year}-{month:02d}-{day.zfill(2)}"
         else:
             formatted_date = ""
         
         # Parse time part (e.g., "15.22 WIB")
         time_components = time_part.split()
-        if len(time_components) >= 1:
-            time_str = time_components[0]
+        if time_components:
             # Convert dot to colon (15.22 -> 15:22)
-            time_parts = time_str.split('.')
+            time_parts = time_components[0].split('.')
             if len(time_parts) == 2:
-                hour = time_parts[0].zfill(2)
-                minute = time_parts[1].zfill(2)
-                formatted_time = f"{hour}:{minute}:00"
+                hour, minute = time_parts
+                formatted_time = f"{hour.zfill(2)}:{minute.zfill(2)}:00"
             else:
                 formatted_time = ""
             timezone = time_components[1] if len(time_components) > 1 else ""
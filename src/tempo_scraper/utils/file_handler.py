@@ -1,14 +1,286 @@
 """File handling utilities for Tempo.co scraper."""
 
+import contextlib
+import functools
+import gzip
 import logging
 import json
+import multiprocessing
 import os
+import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import fields
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import repeat
+from operator import attrgetter
+from typing import BinaryIO, DefaultDict, Final, Iterator, List, Dict, Any, Optional, Tuple
+from ..core.config import PROCESS_POOL_START_METHOD
 from ..models.article import Article
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
 logger = logging.getLogger('tempo_scraper')
 
+# Fields kept for each article when full content is not extracted
+SIMPLIFIED_FIELDS: Final = ("url", "title", "category", "is_free")
+get_simplified_fields: Final = attrgetter(*(f"metadata.{field}" for field in SIMPLIFIED_FIELDS))
+get_category: Final = attrgetter("metadata.category")
+
+# Minimum number of articles for which category files are encoded in
+# worker processes when orjson is not available
+PARALLEL_ENCODE_MIN_ARTICLES: Final = 2000
+
+# gzip level for compressed output; the fastest level still shrinks the
+# repetitive JSON several times over while costing little CPU
+COMPRESS_LEVEL: Final = 1
+
+# Number of articles encoded per call when streaming an index document;
+# large enough to amortize the per-call encoder overhead, small enough to
+# keep only a slice of the output in memory
+STREAM_CHUNK_SIZE: Final = 256
+
+# Fixed framing of a streamed index document, keyed by whether it is
+# indented, so only the metadata and the articles are encoded per run
+INDEX_DOCUMENT_PREFIX: Final = {False: b'{"metadata":', True: b'{\n  "metadata": '}
+INDEX_ARTICLES_OPEN: Final = {False: b',"articles":[', True: b',\n  "articles": ['}
+INDEX_DOCUMENT_SUFFIX: Final = {False: b']}', True: b'\n  ]\n}'}
+
+# Timestamp formats used in output file names and in output metadata
+FILENAME_TIMESTAMP_FORMAT: Final = "%Y%m%d_%H%M%S"
+METADATA_TIMESTAMP_FORMAT: Final = "%Y/%m/%d %H:%M:%S"
+
+@contextlib.contextmanager
+def atomic_open(output_file: str, buffering: int = -1, compress: bool = False) -> Iterator[BinaryIO]:
+    """
+    Open a file for binary writing that only appears once fully written.
+    
+    The data goes to a temporary file in the same directory, which replaces
+    output_file when the block finishes. If the block fails, the temporary
+    file is removed and any existing output_file is left untouched, so a
+    crash never leaves a truncated document behind.
+    
+    Args:
+        output_file: Final path of the file
+        buffering: Buffer size passed to open (default: the system default)
+        compress: Whether to gzip the data written to the file (default: False)
+        
+    Yields:
+        Binary file to write to
+    """
+    directory, filename = os.path.split(output_file)
+    tmp_file = os.path.join(directory, f".{filename}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_file, 'xb', buffering=buffering) as f:
+            if compress:
+                # A fixed mtime keeps the output identical for identical data
+                with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=COMPRESS_LEVEL, mtime=0) as gz:
+                    yield gz
+            else:
+                yield f
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+        raise
+
+def write_file_atomic(output_file: str, data: bytes, compress: bool = False) -> None:
+    """
+    Write bytes to a file atomically.
+    
+    Args:
+        output_file: Final path of the file
+        data: Content to write
+        compress: Whether to gzip the content (default: False)
+    """
+    with atomic_open(output_file, compress=compress) as f:
+        f.write(data)
+
+@functools.lru_cache(maxsize=None)
+def dataclass_field_names(cls: type) -> Tuple[str, ...]:
+    """
+    Get the field names of a dataclass, looked up once per class.
+    
+    Args:
+        cls: Dataclass type
+        
+    Returns:
+        Field names in declaration order
+    """
+    return tuple(field.name for field in fields(cls))
+
+def dataclass_to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Convert a dataclass instance to a shallow dict for the json encoder.
+    
+    Nested dataclasses are left in place; the encoder calls back into this
+    hook for each of them, so nothing is deep-copied the way asdict would.
+    
+    Args:
+        obj: Dataclass instance
+        
+    Returns:
+        Field values keyed by field name
+        
+    Raises:
+        TypeError: If obj is not a dataclass instance
+    """
+    return {name: getattr(obj, name) for name in dataclass_field_names(type(obj))}
+
+def encode_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Encode data as UTF-8 JSON.
+    
+    Args:
+        data: Data to encode; dataclasses are encoded as objects
+        pretty: Whether to indent the output by two spaces (default: False)
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        # orjson walks dataclasses natively and returns UTF-8 bytes directly
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2, default=dataclass_to_dict).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=dataclass_to_dict).encode('utf-8')
+
+def encode_json_line(data: Any) -> bytes:
+    """
+    Encode data as a compact, newline-terminated UTF-8 JSON line.
+    
+    Args:
+        data: Data to encode; dataclasses are encoded as objects
+        
+    Returns:
+        Encoded JSON line
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=dataclass_to_dict).encode('utf-8') + b'\n'
+
+def decode_json(data: bytes) -> Any:
+    """
+    Decode a UTF-8 JSON document.
+    
+    Args:
+        data: Encoded JSON document
+        
+    Returns:
+        Decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_streamed_index(f: BinaryIO, output_data: Dict[str, Any], pretty: bool = False) -> None:
+    """
+    Write an index document, encoding its articles a slice at a time.
+    
+    The output is identical to encoding the whole document at once, but only
+    one slice of articles is held in encoded form at any time.
+    
+    Args:
+        f: Binary file to write to
+        output_data: Document with "metadata" and an "articles" list
+        pretty: Whether to indent the output by two spaces (default: False)
+    """
+    articles = output_data["articles"]
+    metadata = encode_json(output_data["metadata"], pretty)
+    if pretty:
+        # Raw newlines only appear between JSON tokens (newlines inside
+        # strings are escaped), so nested documents are indented by
+        # prefixing each line
+        metadata = metadata.replace(b'\n', b'\n  ')
+    f.write(INDEX_DOCUMENT_PREFIX[pretty] + metadata + INDEX_ARTICLES_OPEN[pretty])
+    
+    if not articles:
+        f.write(b']\n}' if pretty else b']}')
+        return
+    
+    # Encode the articles a slice at a time and drop the brackets of each
+    # encoded list, so the encoder is called once per slice, not per article
+    for start in range(0, len(articles), STREAM_CHUNK_SIZE):
+        encoded = encode_json(articles[start:start + STREAM_CHUNK_SIZE], pretty)
+        if start:
+            f.write(b',')
+        if pretty:
+            # The slice is "[\n  ...\n]" with items indented by two spaces;
+            # the articles sit one level deeper in the document
+            f.write(b'\n  ' + encoded[2:-2].replace(b'\n', b'\n  '))
+        else:
+            f.write(encoded[1:-1])
+    
+    f.write(INDEX_DOCUMENT_SUFFIX[pretty])
+
+def has_full_content(scraping_options: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether index output should include full article data.
+    
+    Args:
+        scraping_options: Options used for scraping
+        
+    Returns:
+        True unless the options say content was not extracted
+    """
+    return not scraping_options or bool(scraping_options.get("extract_content", False))
+
+def build_article_entries(articles: List[Article], extract_content: bool) -> List[Any]:
+    """
+    Build the output entry of each article.
+    
+    Args:
+        articles: List of articles
+        extract_content: Whether full content was extracted
+        
+    Returns:
+        The articles themselves when content was extracted, since they are
+        encoded straight from the dataclasses; otherwise dicts holding only
+        the simplified metadata fields
+    """
+    if extract_content:
+        return articles
+    return [dict(zip(SIMPLIFIED_FIELDS, get_simplified_fields(article))) for article in articles]
+
+def group_by_category(articles: List[Article], entries: List[Any]) -> Dict[str, List[Any]]:
+    """
+    Group output entries by the category of their article.
+    
+    Args:
+        articles: Articles the entries were built from
+        entries: Output entry of each article, in the same order
+        
+    Returns:
+        Entries keyed by category, in order of first appearance
+    """
+    # One pass over the articles; the counts are the list lengths, so they
+    # need no second traversal
+    categorized: DefaultDict[str, List[Any]] = defaultdict(list)
+    for category, entry in zip(map(get_category, articles), entries):
+        categorized[category].append(entry)
+    return categorized
+
+def encode_category_shard(shard: Tuple[str, List[Any]], pretty: bool = False) -> bytes:
+    """
+    Encode the file content of one category.
+    
+    This is a top-level function so it can run in a worker process.
+    
+    Args:
+        shard: Category name and its article entries
+        pretty: Whether to indent the JSON output (default: False)
+        
+    Returns:
+        Encoded category document
+    """
+    category, category_articles = shard
+    
+    # Create the category data structure
+    return encode_json({category: category_articles}, pretty)
+
 def save_categorized_articles_to_files(
     articles: List[Article],
     output_dir: str,
@@ -16,7 +288,9 @@ def save_categorized_articles_to_files(
     metadata_timestamp: str,
     scraping_options: Dict[str, Any] = None,
     extract_content: bool = False,
-    output_filename: Optional[str] = None
+    output_filename: Optional[str] = None,
+    pretty: bool = False,
+    compress: bool = False
 ) -> str:
     """
     Save categorized articles to separate files in a timestamped directory.
@@ -29,6 +303,8 @@ def save_categorized_articles_to_files(
         scraping_options: Options used for scraping
         extract_content: Whether full content was extracted
         output_filename: Custom output name (without extension) (default: None)
+        pretty: Whether to indent the JSON output (default: False)
+        compress: Whether to gzip the files, adding a .gz suffix (default: False)
         
     Returns:
         Path to the created directory
@@ -40,51 +316,37 @@ def save_categorized_articles_to_files(
         category_dir = os.path.join(output_dir, f"indeks_{filename_timestamp}")
     os.makedirs(category_dir, exist_ok=True)
     
+    # Convert articles once, based on whether we have full content or not
+    article_entries = build_article_entries(articles, extract_content)
+    
     # Categorize articles
-    categorized_articles = {}
-    category_counts = {}
-    
-    # Process articles and group by category
-    for article in articles:
-        # Convert article to dictionary format based on whether we have full content or not
-        if extract_content:
-            # Full article data - convert the entire Article object to dict
-            article_dict = {
-                "metadata": article.metadata.__dict__,
-                "content": article.content,
-                "tags": article.tags
-            }
-            category = article.metadata.category
-        else:
-            # Simplified article data - just the metadata fields
-            article_dict = {
-                "url": article.metadata.url,
-                "title": article.metadata.title,
-                "category": article.metadata.category,
-                "is_free": article.metadata.is_free
-            }
-            category = article.metadata.category
-        
-        if category not in categorized_articles:
-            categorized_articles[category] = []
-            category_counts[category] = 0
-        categorized_articles[category].append(article_dict)
-        category_counts[category] += 1
-    
-    # Save each category to a separate file
-    for category, category_articles in categorized_articles.items():
-        # Create category filename (sanitize for filesystem)
-        category_filename = f"{category}.json"
-        category_file_path = os.path.join(category_dir, category_filename)
-        
-        # Create the category data structure
-        category_data = {category: category_articles}
-        
-        # Save category file
-        with open(category_file_path, 'w', encoding='utf-8') as f:
-            json.dump(category_data, f, ensure_ascii=False, indent=2)
-    
-    # Create and save metadata
+    categorized_articles = group_by_category(articles, article_entries)
+    category_counts = {category: len(entries) for category, entries in categorized_articles.items()}
+    
+    # Encode each category file up front; the files are written together below.
+    # The standard library encoder is pure Python for dataclasses and holds the
+    # GIL, so large multi-category dumps without orjson are encoded across
+    # worker processes; orjson encodes faster than the shards could be pickled
+    shards = list(categorized_articles.items())
+    if orjson is None and len(shards) > 1 and len(articles) >= PARALLEL_ENCODE_MIN_ARTICLES:
+        with ProcessPoolExecutor(
+            max_workers=min(len(shards), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(PROCESS_POOL_START_METHOD)
+        ) as executor:
+            encoded_shards = list(executor.map(encode_category_shard, shards, repeat(pretty)))
+    else:
+        encoded_shards = [encode_category_shard(shard, pretty) for shard in shards]
+    
+    # Join the category paths onto a prefix computed once; os.path.join
+    # would redo the separator handling for every category
+    category_prefix = category_dir + os.sep
+    suffix = ".json.gz" if compress else ".json"
+    writes: List[Tuple[str, bytes]] = [
+        (f"{category_prefix}{category}{suffix}", encoded)
+        for (category, _), encoded in zip(shards, encoded_shards)
+    ]
+    
+    # Create metadata
     metadata = {
         "type": "index",
         "timestamp": metadata_timestamp,
@@ -93,20 +355,70 @@ def save_categorized_articles_to_files(
         "categories": category_counts
     }
     
-    metadata_file_path = os.path.join(category_dir, "metadata.json")
-    with open(metadata_file_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    metadata_file_path = os.path.join(category_dir, f"metadata{suffix}")
+    writes.append((metadata_file_path, encode_json(metadata, pretty)))
+    
+    # Write all files concurrently so their open, write and close calls
+    # overlap instead of running one file after another
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda write: write_file_atomic(*write, compress=compress), writes))
     
     logger.info(f"Successfully saved {len(articles)} articles to {category_dir}")
     return category_dir
 
+def build_index_payload(
+    articles: List[Article],
+    scraping_options: Optional[Dict[str, Any]] = None,
+    categorize: bool = False,
+    metadata_timestamp: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the document saved for an index scraping run.
+    
+    Args:
+        articles: List of articles to include
+        scraping_options: Options used for scraping
+        categorize: Whether to group the articles by category
+        metadata_timestamp: Timestamp recorded in the metadata (default: current time)
+        
+    Returns:
+        Document with "metadata" and "articles" keys
+    """
+    if metadata_timestamp is None:
+        metadata_timestamp = datetime.now().strftime(METADATA_TIMESTAMP_FORMAT)
+    
+    # Index scraping - include filter info
+    # Convert the articles once; both the flat and categorized layouts
+    # below are fed from this one list
+    article_entries = build_article_entries(articles, has_full_content(scraping_options))
+    
+    output_metadata: Dict[str, Any] = {
+        "type": "index",
+        "timestamp": metadata_timestamp,
+        "scraping_options": scraping_options or {},
+        "total_articles": len(articles)
+    }
+    
+    # Categorize articles if requested (old method - kept for backward compatibility)
+    if categorize:
+        categorized_articles = group_by_category(articles, article_entries)
+        output_metadata["categories"] = {
+            category: len(entries) for category, entries in categorized_articles.items()
+        }
+        return {"metadata": output_metadata, "articles": categorized_articles}
+    
+    return {"metadata": output_metadata, "articles": article_entries}
+
 def save_articles_to_json(
     articles: List[Article],
     output_dir: str,
     is_index_scraping: bool = True,
     scraping_options: Dict[str, Any] = None,
     categorize: bool = False,
-    output_filename: Optional[str] = None
+    output_filename: Optional[str] = None,
+    pretty: bool = False,
+    now: Optional[datetime] = None,
+    compress: bool = False
 ) -> str:
     """
     Save articles data to a JSON file with timestamp-based naming.
@@ -118,6 +430,9 @@ def save_articles_to_json(
         scraping_options: Options used for scraping
         categorize: Whether to categorize articles by category
         output_filename: Custom output name (without extension) (default: None)
+        pretty: Whether to indent the JSON output (default: False)
+        now: Time to stamp the output with, shared by files saved together (default: current time)
+        compress: Whether to gzip index output, adding a .gz suffix (default: False)
         
     Returns:
         Path to the saved file or directory
@@ -126,9 +441,10 @@ def save_articles_to_json(
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate timestamps
-    now = datetime.now()
-    filename_timestamp = now.strftime("%Y%m%d_%H%M%S")
-    metadata_timestamp = now.strftime("%Y/%m/%d %H:%M:%S")
+    if now is None:
+        now = datetime.now()
+    filename_timestamp = now.strftime(FILENAME_TIMESTAMP_FORMAT)
+    metadata_timestamp = now.strftime(METADATA_TIMESTAMP_FORMAT)
     
     # Handle categorization differently - create separate files
     if is_index_scraping and categorize:
@@ -140,7 +456,9 @@ def save_articles_to_json(
             metadata_timestamp, 
             scraping_options, 
             extract_content,
-            output_filename
+            output_filename,
+            pretty,
+            compress
         )
     
     # Create filename with timestamp or custom name
@@ -157,97 +475,115 @@ def save_articles_to_json(
             output_filename = f"article_{filename_timestamp}.json"
         output_file = os.path.join(output_dir, output_filename)
     
-    if is_index_scraping:
-        # Index scraping - include filter info
-        # If extract_content is false, only include specific fields
-        if scraping_options and not scraping_options.get("extract_content", False):
-            # Create simplified article data with only the required fields
-            simplified_articles = []
-            for article in articles:
-                simplified_article = {
-                    "url": article.metadata.url,
-                    "title": article.metadata.title,
-                    "category": article.metadata.category,
-                    "is_free": article.metadata.is_free
-                }
-                simplified_articles.append(simplified_article)
-            
-            # Categorize articles if requested (old method - kept for backward compatibility)
-            if categorize:
-                categorized_articles = {}
-                category_counts = {}
-                for article in simplified_articles:
-                    category = article["category"]
-                    if category not in categorized_articles:
-                        categorized_articles[category] = []
-                        category_counts[category] = 0
-                    categorized_articles[category].append(article)
-                    category_counts[category] += 1
-                
-                output_data = {
-                    "metadata": {
-                        "type": "index",
-                        "timestamp": metadata_timestamp,
-                        "scraping_options": scraping_options or {},
-                        "total_articles": len(articles),
-                        "categories": category_counts
-                    },
-                    "articles": categorized_articles
-                }
-            else:
-                output_data = {
-                    "metadata": {
-                        "type": "index",
-                        "timestamp": metadata_timestamp,
-                        "scraping_options": scraping_options or {},
-                        "total_articles": len(articles)
-                    },
-                    "articles": simplified_articles
-                }
-        else:
-            # Include full article data
-            # Categorize articles if requested (old method - kept for backward compatibility)
-            if categorize:
-                categorized_articles = {}
-                category_counts = {}
-                for article in articles:
-                    category = article.metadata.category
-                    if category not in categorized_articles:
-                        categorized_articles[category] = []
-                        category_counts[category] = 0
-                    categorized_articles[category].append(article.__dict__)
-                    category_counts[category] += 1
-                
-                output_data = {
-                    "metadata": {
-                        "type": "index",
-                        "timestamp": metadata_timestamp,
-                        "scraping_options": scraping_options or {},
-                        "total_articles": len(articles),
-                        "categories": category_counts
-                    },
-                    "articles": categorized_articles
-                }
+    # Single article extraction writes one small document directly
+    if not is_index_scraping:
+        return save_single_article(articles[0] if articles else None, output_file, pretty)
+    
+    if compress:
+        output_file += ".gz"
+    
+    output_data = build_index_payload(articles, scraping_options, categorize, metadata_timestamp)
+    # The flat article list can be large, so write it out a slice at a
+    # time instead of encoding the whole document in memory
+    stream_articles = not categorize
+    
+    try:
+        # A large buffer lets the many small writes of a streamed document
+        # reach the disk in a few system calls
+        with atomic_open(output_file, buffering=1 << 20, compress=compress) as f:
+            if stream_articles:
+                write_streamed_index(f, output_data, pretty)
             else:
-                output_data = {
-                    "metadata": {
-                        "type": "index",
-                        "timestamp": metadata_timestamp,
-                        "scraping_options": scraping_options or {},
-                        "total_articles": len(articles)
-                    },
-                    "articles": [article.__dict__ for article in articles]
-                }
+                f.write(encode_json(output_data, pretty))
+        
+        logger.info(f"Successfully saved {len(articles)} articles to {output_file}")
+        return output_file
+    except Exception as e:
+        logger.error(f"Error saving to JSON file: {e}")
+        raise
+
+def save_single_article(article: Optional[Article], output_file: str, pretty: bool = False) -> str:
+    """
+    Save a single extracted article to a JSON file.
+    
+    Args:
+        article: Article to save; None writes an empty object
+        output_file: Path of the file to write
+        pretty: Whether to indent the JSON output (default: False)
+        
+    Returns:
+        Path to the saved file
+    """
+    try:
+        # The document is small, so encode it and write it in one call
+        with atomic_open(output_file) as f:
+            f.write(encode_json(article if article is not None else {}, pretty))
+        
+        logger.info(f"Successfully saved article to {output_file}")
+        return output_file
+    except Exception as e:
+        logger.error(f"Error saving to JSON file: {e}")
+        raise
+
+def save_articles_to_ndjson(
+    articles: List[Article],
+    output_dir: str,
+    scraping_options: Dict[str, Any] = None,
+    output_filename: Optional[str] = None,
+    now: Optional[datetime] = None,
+    compress: bool = False
+) -> str:
+    """
+    Save index scraping results as newline-delimited JSON.
+    
+    The first line holds the scraping metadata and every following line holds
+    one article, so articles are encoded and written one at a time and the
+    file can be read back line by line.
+    
+    Args:
+        articles: List of articles to save
+        output_dir: Directory to save the file
+        scraping_options: Options used for scraping
+        output_filename: Custom output name (without extension) (default: None)
+        now: Time to stamp the output with, shared by files saved together (default: current time)
+        compress: Whether to gzip the file, adding a .gz suffix (default: False)
+        
+    Returns:
+        Path to the saved file
+    """
+    # Ensure output directory exists
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Generate timestamps
+    if now is None:
+        now = datetime.now()
+    metadata_timestamp = now.strftime(METADATA_TIMESTAMP_FORMAT)
+    
+    # Create filename with timestamp or custom name
+    if output_filename:
+        if not output_filename.endswith('.jsonl'):
+            output_filename = f"{output_filename}.jsonl"
     else:
-        # Single article extraction
-        output_data = articles[0].__dict__ if articles else {}
+        output_filename = f"indeks_{now.strftime(FILENAME_TIMESTAMP_FORMAT)}.jsonl"
+    output_file = os.path.join(output_dir, output_filename)
+    if compress:
+        output_file += ".gz"
+    
+    metadata = {
+        "type": "index",
+        "timestamp": metadata_timestamp,
+        "scraping_options": scraping_options or {},
+        "total_articles": len(articles)
+    }
     
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2, default=lambda o: o.__dict__)
+        with atomic_open(output_file, buffering=1 << 20, compress=compress) as f:
+            f.write(encode_json_line({"metadata": metadata}))
+            for entry in build_article_entries(articles, has_full_content(scraping_options)):
+                f.write(encode_json_line(entry))
         
         logger.info(f"Successfully saved {len(articles)} articles to {output_file}")
         return output_file
     except Exception as e:
-        logger.error(f"Error saving to JSON file: {e}")
+        logger.error(f"Error saving to NDJSON file: {e}")
         raise
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""Conditional request cache for Tempo.co index pages."""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Mapping, Optional
+from ..models.article import ArticleMetadata
+from .file_handler import dataclass_field_names, dataclass_to_dict, decode_json, encode_json, write_file_atomic
+
+logger = logging.getLogger('tempo_scraper')
+
+# Path of the cache file inside the output directory
+PAGE_CACHE_FILENAME = os.path.join(".cache", "etag.json")
+
+# Maximum number of pages kept in the cache; the least recently used pages
+# are dropped first when it is saved
+MAX_CACHE_ENTRIES = 1000
+
+def is_valid_entry(entry: Any) -> bool:
+    """
+    Check that a loaded cache entry has the shape written by IndexPageCache.store.
+    
+    Args:
+        entry: Decoded cache entry
+    
+    Returns:
+        True if the entry can be used for conditional requests
+    """
+    if not isinstance(entry, dict):
+        return False
+    if not all(isinstance(entry.get(key), (str, type(None))) for key in ("etag", "last_modified")):
+        return False
+    article_per_page = entry.get("article_per_page")
+    if not isinstance(article_per_page, int) or isinstance(article_per_page, bool):
+        return False
+    articles = entry.get("articles")
+    if not isinstance(articles, list):
+        return False
+    # Every article must map back onto ArticleMetadata
+    field_names = set(dataclass_field_names(ArticleMetadata))
+    return all(
+        isinstance(article, dict) and {"url", "title", "category"} <= article.keys() <= field_names
+        for article in articles
+    )
+
+class IndexPageCache:
+    """
+    Cache of index page validators and the articles parsed from each page.
+    
+    The ETag and Last-Modified headers of a page are sent back as
+    If-None-Match and If-Modified-Since on the next run, so an unchanged
+    page is answered with an empty 304 and its cached articles are reused
+    without downloading or parsing it again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        entries: Optional[Dict[str, dict]] = None,
+        max_entries: int = MAX_CACHE_ENTRIES
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: JSON file the cache is persisted to
+            entries: Cached entries keyed by page URL, least recently used first
+            max_entries: Maximum number of pages kept when saving (default: MAX_CACHE_ENTRIES)
+        """
+        self.path = path
+        self.entries = entries or {}
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "IndexPageCache":
+        """
+        Load the cache from disk, starting empty if it is missing, unreadable or malformed.
+        
+        Args:
+            path: JSON file the cache is persisted to
+        
+        Returns:
+            Loaded cache
+        """
+        try:
+            with open(path, 'rb') as f:
+                entries = decode_json(f.read())
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable page cache {path}: {e}")
+            return cls(path)
+        
+        # A cache that does not have the expected shape would make every
+        # lookup fail, so start over rather than trust any part of it
+        if not isinstance(entries, dict) or not all(
+            isinstance(url, str) and is_valid_entry(entry) for url, entry in entries.items()
+        ):
+            logger.warning(f"Ignoring malformed page cache {path}")
+            return cls(path)
+        return cls(path, entries)
+
+    def save(self) -> None:
+        """Write the cache to disk, keeping only the most recently used pages."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            # Entries are kept in order of use, so the oldest come first
+            for url in list(self.entries)[:max(len(self.entries) - self.max_entries, 0)]:
+                del self.entries[url]
+            # Written atomically, so an interrupted run keeps the old cache
+            write_file_atomic(self.path, encode_json(self.entries))
+
+    def request_headers(self, url: str, article_per_page: int) -> Dict[str, str]:
+        """
+        Build the conditional request headers for a page.
+        
+        Args:
+            url: URL of the index page
+            article_per_page: Article limit the page will be parsed with
+        
+        Returns:
+            Headers to send, empty if the page has no usable cache entry
+        """
+        entry = self.entries.get(url)
+        # Cached articles were cut to the limit of their run, so they only
+        # stand in for this request if the limit is the same
+        if not entry or entry["article_per_page"] != article_per_page:
+            return {}
+        
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get_articles(self, url: str) -> Optional[List[ArticleMetadata]]:
+        """
+        Get the cached articles of a page.
+        
+        Args:
+            url: URL of the index page
+        
+        Returns:
+            List of article metadata, or None if the page is not cached
+        """
+        with self._lock:
+            entry = self.entries.pop(url, None)
+            if entry is None:
+                return None
+            # Re-insert the page at the end so it is evicted last
+            self.entries[url] = entry
+        return [ArticleMetadata(**article) for article in entry["articles"]]
+
+    def store(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        article_per_page: int,
+        articles: List[ArticleMetadata]
+    ) -> None:
+        """
+        Remember the validators and parsed articles of a page.
+        
+        Args:
+            url: URL of the index page
+            headers: Response headers of the page
+            article_per_page: Article limit the page was parsed with
+            articles: Articles parsed from the page
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        
+        with self._lock:
+            # Re-inserting below moves the page to the end, so it is evicted last
+            self.entries.pop(url, None)
+            
+            # Without validators the page can never be answered with a 304
+            if not etag and not last_modified:
+                return
+            
+            self.entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "article_per_page": article_per_page,
+                # Metadata fields are all scalars, so a shallow copy suffices
+                "articles": [dataclass_to_dict(article) for article in articles]
+            }
@@ -1,8 +1,56 @@
 """URL building utilities for Tempo.co scraper."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
-from ..core.selectors import BASE_URL
+from urllib.parse import urlencode
+from ..core.selectors import BASE_URL, ARTICLE_BASE_URL
+from .date_parser import parse_ymd
+
+def rubric_query(rubric: str) -> str:
+    """
+    Build the query string tail for a rubric filter.
+    
+    Args:
+        rubric: Rubric slug
+        
+    Returns:
+        Query string tail, starting with "&"
+    """
+    return "&" + urlencode({"category": "rubrik", "rubric_slug": rubric})
+
+def date_query(start_date: str, end_date: str) -> str:
+    """
+    Build the query string tail for a date range filter.
+    
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        
+    Returns:
+        Query string tail, starting with "&"
+    """
+    return "&" + urlencode({"category": "date", "start_date": start_date, "end_date": end_date})
+
+# Everything before the page number, built once
+INDEX_URL_PREFIX = f"{BASE_URL}?page="
+
+# Query string tail builders keyed by which of (rubric, start_date, end_date)
+# are set. Rubric and date filters are mutually exclusive, with rubric taking
+# precedence; a single date is widened to a 1-day range.
+INDEX_QUERY_TAILS = {
+    **{
+        (True, has_start, has_end): lambda rubric, start, end: rubric_query(rubric)
+        for has_start in (False, True) for has_end in (False, True)
+    },
+    (False, True, True): lambda rubric, start, end: date_query(start, end),
+    (False, True, False): lambda rubric, start, end: date_query(
+        start, (parse_ymd(start) + timedelta(days=1)).isoformat()
+    ),
+    (False, False, True): lambda rubric, start, end: date_query(
+        (parse_ymd(end) - timedelta(days=1)).isoformat(), end
+    ),
+    (False, False, False): lambda rubric, start, end: "",
+}
 
 def build_index_url(
     page: int = 1,
@@ -24,23 +72,20 @@ def build_index_url(
     Returns:
         Constructed URL
     """
-    url = f"{BASE_URL}?page={page}"
-    
-    # Add rubric parameter if provided (takes precedence over date filters)
-    if rubric:
-        url += f"&category=rubrik&rubric_slug={rubric}"
-    # Add date parameters if provided (only if rubric is not provided)
-    elif start_date and end_date:
-        url += f"&category=date&start_date={start_date}&end_date={end_date}"
-    elif start_date:  # Only start_date provided, create 1-day difference
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = start_dt + timedelta(days=1)
-        end_date = end_dt.strftime("%Y-%m-%d")
-        url += f"&category=date&start_date={start_date}&end_date={end_date}"
-    elif end_date:  # Only end_date provided, create 1-day difference
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-        start_dt = end_dt - timedelta(days=1)
-        start_date = start_dt.strftime("%Y-%m-%d")
-        url += f"&category=date&start_date={start_date}&end_date={end_date}"
+    # Pick the query tail for this combination of filters with one lookup
+    build_tail = INDEX_QUERY_TAILS[bool(rubric), bool(start_date), bool(end_date)]
+    return f"{INDEX_URL_PREFIX}{page}{build_tail(rubric, start_date, end_date)}"
+
+def build_article_url(url: str) -> str:
+    """
+    Build the absolute URL of an article from its index page link.
     
-    return url
\ No newline at end of file
+    Args:
+        url: Article link, relative to the site root or absolute
+        
+    Returns:
+        Absolute article URL
+    """
+    # Index links are root-relative paths; a plain prefix check and concat
+    # is all the joining they need, without urljoin's general parsing
+    return ARTICLE_BASE_URL + url if url[:1] == '/' else url
\ No newline at end of file
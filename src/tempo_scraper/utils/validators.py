@@ -1,11 +1,94 @@
 """Validation utilities for Tempo.co scraper."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Tuple, Optional
+from .date_parser import parse_ymd
 
 logger = logging.getLogger('tempo_scraper')
 
+def date_format_error(date_str: Optional[str], date_type: str) -> Optional[str]:
+    """
+    Check that the date string is in YYYY-MM-DD format.
+    
+    Args:
+        date_str: Date string to check
+        date_type: Type of date (for error messages)
+        
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if date_str:
+        try:
+            parse_ymd(date_str)
+        except ValueError:
+            return f"Error: {date_type} must be in YYYY-MM-DD format"
+    return None
+
+def date_range_error(start_date: Optional[str], end_date: Optional[str]) -> Optional[str]:
+    """
+    Check that start_date is not later than end_date.
+    
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if start_date and end_date and parse_ymd(start_date) > parse_ymd(end_date):
+        return "Error: start-date cannot be later than end-date"
+    return None
+
+def page_range_error(start_page: int, end_page: int) -> Optional[str]:
+    """
+    Check that the page range is not too large.
+    
+    Args:
+        start_page: Starting page number
+        end_page: Ending page number
+        
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if end_page - start_page > 50:
+        return ("Warning: You're trying to scrape more than 50 pages. "
+                "Please limit your scraping to be respectful to the server.")
+    return None
+
+def concurrency_error(max_concurrency: int) -> Optional[str]:
+    """
+    Check that the number of concurrent requests is in a respectful range.
+    
+    Args:
+        max_concurrency: Maximum number of requests in flight at once
+        
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if not 1 <= max_concurrency <= 8:
+        return ("Invalid max-concurrency. Please use between 1 and 8 concurrent "
+                "requests to be respectful to the server.")
+    return None
+
+def output_format_error(stream: bool, categorize: bool, pretty: bool) -> Optional[str]:
+    """
+    Check that the requested output options can be combined.
+    
+    Args:
+        stream: Whether to write a JSON lines file
+        categorize: Whether to write one file per category
+        pretty: Whether to indent the JSON output
+        
+    Returns:
+        None if valid, otherwise the error message
+    """
+    if stream and categorize:
+        return "Invalid options. --stream cannot be combined with --categorize."
+    if stream and pretty:
+        return "Invalid options. --stream writes one article per line and cannot be combined with --pretty."
+    return None
+
 def validate_date_format(date_str: str, date_type: str) -> bool:
     """
     Validate that the date string is in YYYY-MM-DD format.
@@ -17,14 +100,10 @@ def validate_date_format(date_str: str, date_type: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if date_str:
-        try:
-            datetime.strptime(date_str, '%Y-%m-%d')
-            return True
-        except ValueError:
-            logger.error(f"Error: {date_type} must be in YYYY-MM-DD format")
-            return False
-    return True
+    error = date_format_error(date_str, date_type)
+    if error:
+        logger.error(error)
+    return error is None
 
 def validate_date_range(start_date: str, end_date: str) -> bool:
     """
@@ -37,14 +116,10 @@ def validate_date_range(start_date: str, end_date: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if start_date and end_date:
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-        
-        if start_dt > end_dt:
-            logger.error("Error: start-date cannot be later than end-date")
-            return False
-    return True
+    error = date_range_error(start_date, end_date)
+    if error:
+        logger.error(error)
+    return error is None
 
 def validate_page_range(start_page: int, end_page: int) -> bool:
     """
@@ -57,11 +132,10 @@ def validate_page_range(start_page: int, end_page: int) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if end_page - start_page > 50:
-        logger.warning("Warning: You're trying to scrape more than 50 pages.")
-        logger.warning("Please limit your scraping to be respectful to the server.")
-        return False
-    return True
+    error = page_range_error(start_page, end_page)
+    if error:
+        logger.warning(error)
+    return error is None
 
 def process_dates(start_date: Optional[str], end_date: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -76,13 +150,9 @@ def process_dates(start_date: Optional[str], end_date: Optional[str]) -> Tuple[O
     """
     # If only start_date is provided, create 1-day difference
     if start_date and not end_date:
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-        end_dt = start_dt + timedelta(days=1)
-        end_date = end_dt.strftime('%Y-%m-%d')
+        end_date = (parse_ymd(start_date) + timedelta(days=1)).isoformat()
     # If only end_date is provided, create 1-day difference
     elif end_date and not start_date:
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-        start_dt = end_dt - timedelta(days=1)
-        start_date = start_dt.strftime('%Y-%m-%d')
+        start_date = (parse_ymd(end_date) - timedelta(days=1)).isoformat()
     
     return start_date, end_date
\ No newline at end of file
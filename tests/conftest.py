@@ -0,0 +1,135 @@
+"""
+Shared pytest configuration for the Tempo.co scraper tests
+"""
+
+import io
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.models import Response
+
+from tempo_scraper.core.session import RETRY_STRATEGY, create_session, get_session
+from tempo_scraper.models.article import ArticleMetadata
+
+# src is put on the import path by the pythonpath setting in pyproject.toml
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+class FixtureAdapter(BaseAdapter):
+    """Transport adapter answering every request with a saved Tempo.co page"""
+
+    def __init__(self, status_code=200, etag=None):
+        super().__init__()
+        self.status_code = status_code
+        # ETag sent with every page; a matching If-None-Match gets a 304
+        self.etag = etag
+        # Requests sent through the adapter, in arrival order
+        self.requested = []
+
+    def send(self, request, **kwargs):
+        self.requested.append(request)
+        
+        response = Response()
+        response.url = request.url
+        response.request = request
+        
+        if self.etag is not None:
+            response.headers["ETag"] = self.etag
+            if request.headers.get("If-None-Match") == self.etag:
+                response.status_code = 304
+                response.raw = io.BytesIO(b"")
+                return response
+        
+        # Index pages live under /indeks; everything else is an article
+        name = "index.html" if urlsplit(request.url).path.startswith("/indeks") else "article.html"
+        with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+            body = f.read()
+        
+        response.status_code = self.status_code
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        response.raw = io.BytesIO(body)
+        return response
+
+    def close(self):
+        pass
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    """Request handler answering every request with 429 Too Many Requests"""
+
+    def do_GET(self):
+        self.server.requested.append(self.path)
+        self.send_response(429)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+def mount_fixture_adapter(monkeypatch, adapter):
+    """Mount adapter on the shared scraper session for the current test"""
+    session = get_session()
+    monkeypatch.setitem(session.adapters, "https://", adapter)
+    monkeypatch.setitem(session.adapters, "http://", adapter)
+    return adapter
+
+@pytest.fixture
+def offline_site(monkeypatch):
+    """Serve the saved pages through the shared scraper session instead of the network"""
+    return mount_fixture_adapter(monkeypatch, FixtureAdapter())
+
+@pytest.fixture
+def etag_site(monkeypatch):
+    """Serve the saved pages with an ETag, answering matching conditional requests with 304"""
+    return mount_fixture_adapter(monkeypatch, FixtureAdapter(etag='"index-v1"'))
+
+@pytest.fixture
+def rate_limited_site(monkeypatch):
+    """
+    Serve 429 Too Many Requests from a local server through the scraper's retry strategy
+    
+    The shared session reaches the server through a real HTTPAdapter, so
+    urllib3 retries every request; only the backoff sleeps are turned off
+    to keep the tests fast. The server records the path of every request.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RateLimitedHandler)
+    server.requested = []
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    
+    mount_fixture_adapter(monkeypatch, HTTPAdapter(max_retries=RETRY_STRATEGY.new(backoff_factor=0)))
+    yield server
+    
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson and once with the standard library encoder"""
+    from tempo_scraper.utils import file_handler
+    
+    if request.param == "orjson":
+        # orjson is an optional extra, so its run is skipped when it is missing
+        monkeypatch.setattr(file_handler, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(file_handler, "orjson", None)
+    return request.param
+
+@pytest.fixture(scope="session")
+def session():
+    """Scraper session, created once and shared by every test that inspects it"""
+    return create_session()
+
+@pytest.fixture
+def metadata():
+    """Metadata of a free test article"""
+    return ArticleMetadata(
+        url="https://www.tempo.co/test",
+        title="Test Article",
+        category="test",
+        is_free=True
+    )
\ No newline at end of file
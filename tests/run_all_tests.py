@@ -3,39 +3,12 @@
 Complete test suite runner for Tempo.co scraper
 """
 
-import subprocess
 import sys
 import os
 
-def run_test_script(script_name, description):
-    """Run a test script and return success status"""
-    print(f"\n{'='*60}")
-    print(f"Running {description}")
-    print(f"{'='*60}")
-    
-    try:
-        result = subprocess.run(
-            ["python", script_name],
-            cwd="/home/fakhry/dev/scraper/tempo",
-            capture_output=True,
-            text=True
-        )
-        
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
-        
-        if result.returncode == 0:
-            print(f"✓ {description} PASSED")
-            return True
-        else:
-            print(f"✗ {description} FAILED")
-            return False
-            
-    except Exception as e:
-        print(f"✗ {description} FAILED with exception: {e}")
-        return False
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
 
 def main():
     """Run all test suites"""
@@ -43,37 +16,44 @@ def main():
     print("=" * 60)
     
     test_scripts = [
-        ("tests/test_comprehensive.py", "Comprehensive Unit Tests"),
-        ("tests/test_integration.py", "Integration Tests"),
-        ("tests/test_article_extractor.py", "Article Extractor Unit Tests"),
-        ("tests/test_categorization.py", "Categorization Feature Tests")
+        ("test_comprehensive.py", "Comprehensive Unit Tests"),
+        ("test_integration.py", "Integration Tests"),
+        ("test_article_extractor.py", "Article Extractor Unit Tests"),
+        ("test_categorization.py", "Categorization Feature Tests"),
+        ("test_file_handler.py", "Output Writer Tests"),
+        ("test_json_to_markdown.py", "JSON to Markdown Converter Tests")
     ]
     
-    passed = 0
-    failed = 0
+    test_paths = []
+    missing = 0
+    
+    # List the tests directory once instead of probing every script
+    with os.scandir(TESTS_DIR) as entries:
+        present = {entry.name for entry in entries}
     
     for script, description in test_scripts:
-        if os.path.exists(os.path.join("/home/fakhry/dev/scraper/tempo", script)):
-            if run_test_script(script, description):
-                passed += 1
-            else:
-                failed += 1
+        if script in present:
+            print(f"Collecting {description}")
+            test_paths.append(os.path.join(TESTS_DIR, script))
         else:
             print(f"Skipping {description} - script not found: {script}")
-            failed += 1
+            missing += 1
+    
+    # Run every suite in this interpreter with pytest instead of starting a
+    # new Python process per script
+    exit_code = pytest.main(["-q", *test_paths])
     
     print("\n" + "=" * 60)
     print("FINAL TEST RESULTS")
     print("=" * 60)
-    print(f"Total test suites: {passed + failed}")
-    print(f"Passed: {passed}")
-    print(f"Failed: {failed}")
+    print(f"Test suites run: {len(test_paths)}")
+    print(f"Test suites missing: {missing}")
     
-    if failed == 0:
+    if exit_code == 0 and missing == 0:
         print("\n🎉 ALL TESTS PASSED! The Tempo.co scraper is working correctly.")
         return 0
     else:
-        print(f"\n❌ {failed} test suite(s) failed. Please check the output above.")
+        print("\n❌ Some tests failed. Please check the output above.")
         return 1
 
 if __name__ == "__main__":
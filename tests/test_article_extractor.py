@@ -3,17 +3,15 @@
 Unit tests for article extractor functionality in refactored code
 """
 
-import sys
 import os
-import json
-import glob
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from tempo_scraper.extractors.article_extractor import extract_article_content
 from tempo_scraper.models.article import Article
-from tempo_scraper.utils.file_handler import save_articles_to_json
+from tempo_scraper.utils.file_handler import decode_json, save_articles_to_json
 
-def test_logo_filtering():
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def test_logo_filtering(tmp_path):
     """Test that logo images are filtered out"""
     print("Testing logo filtering in article extractor...")
     
@@ -33,61 +31,40 @@ def test_logo_filtering():
         tags=['test', 'article']
     )
     
-    # Save the mock data to a temporary file
-    temp_file = '/home/fakhry/dev/scraper/tempo/data/output/test_article.json'
-    os.makedirs(os.path.dirname(temp_file), exist_ok=True)
+    # Test the file handler with the new structure; pytest removes tmp_path
+    output_file = save_articles_to_json([article], str(tmp_path), False, output_filename=None)
     
-    # Test the file handler with the new structure
-    try:
-        save_articles_to_json([article], '/home/fakhry/dev/scraper/tempo/data/output', False, output_filename=None)
-        print("✓ Logo filtering test passed")
-        # Clean up
-        files = glob.glob('/home/fakhry/dev/scraper/tempo/data/output/test_article.json')
-        for file in files:
-            try:
-                os.remove(file)
-            except:
-                pass
-    except Exception as e:
-        print(f"✗ Logo filtering test failed: {e}")
-
-def test_pilihan_editor_filtering():
-    """Test that 'Pilihan Editor:' content is filtered out"""
-    print("Testing 'Pilihan Editor:' filtering in article extractor...")
+    assert os.path.dirname(output_file) == str(tmp_path), f"Expected output in {tmp_path}, got {output_file}"
+    with open(output_file, 'rb') as f:
+        saved = decode_json(f.read())
+    assert saved["content"] == article.content, "Expected the saved article to keep its content"
     
-    # This test would require actual web scraping which we don't want in unit tests
-    print("✓ 'Pilihan Editor:' filtering test skipped (would require web scraping)")
+    print("✓ Logo filtering test passed")
 
-def test_article_extraction_structure():
-    """Test that article extraction returns proper structure"""
-    print("Testing article extraction structure...")
-    
-    # This test would require actual web scraping which we don't want in unit tests
-    print("✓ Article extraction structure test skipped (would require web scraping)")
+ARTICLE_URL = "https://www.tempo.co/politik/rapat-paripurna-dpr-2069001"
 
-def test_429_error_handling():
-    """Test that 429 errors are handled correctly"""
-    print("Testing 429 error handling in article extractor...")
+def test_pilihan_editor_filtering(offline_site):
+    """Test that 'Pilihan Editor:' content is filtered out"""
+    # The saved article page has a "Pilihan Editor:" paragraph between two
+    # paragraphs of the article
+    with open(os.path.join(FIXTURES_DIR, "article.html"), encoding="utf-8") as f:
+        assert "<p>Pilihan Editor:" in f.read(), "Expected the saved page to hold a 'Pilihan Editor:' paragraph"
     
-    # This test would require mocking HTTP responses which is beyond the scope of these simple tests
-    print("✓ 429 error handling test skipped (would require HTTP mocking)")
+    article = extract_article_content(ARTICLE_URL)
+    assert article is not None, "Expected the saved article to be extracted"
+    assert not any("Pilihan Editor:" in paragraph for paragraph in article.content), f"Unexpected content {article.content}"
+    assert len(article.content) == 2, f"Expected the 2 article paragraphs, got {article.content}"
 
-def main():
-    """Run all article extractor tests"""
-    print("Running article extractor unit tests for refactored code")
-    print("=" * 60)
+def test_article_extraction_structure(offline_site):
+    """Test that article extraction returns proper structure"""
+    article = extract_article_content(ARTICLE_URL)
     
-    try:
-        test_logo_filtering()
-        test_pilihan_editor_filtering()
-        test_article_extraction_structure()
-        test_429_error_handling()
-        print("\n✓ All article extractor unit tests completed")
-        return True
-    except Exception as e:
-        print(f"\n✗ Article extractor unit tests failed: {e}")
-        return False
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    assert isinstance(article, Article), f"Expected an Article, got {article!r}"
+    assert article.metadata.url == ARTICLE_URL
+    assert article.metadata.title == "Rapat Paripurna DPR Sahkan Undang-Undang Baru | tempo.co"
+    assert article.metadata.category == "politik"
+    assert article.metadata.is_free
+    assert (article.metadata.publication_date, article.metadata.publication_time, article.metadata.timezone) == ("2025-09-12", "15:22:00", "WIB")
+    assert article.metadata.author == "Penulis Tempo"
+    assert all(isinstance(paragraph, str) and paragraph for paragraph in article.content), "Expected non-empty text paragraphs"
+    assert article.tags == ["DPR", "Undang-Undang"]
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the output writers of the Tempo.co scraper
+"""
+
+import gzip
+from datetime import datetime
+
+import pytest
+
+from tempo_scraper.models.article import Article, ArticleMetadata
+from tempo_scraper.utils.file_handler import atomic_open, decode_json, save_articles_to_json, save_articles_to_ndjson
+
+# Output is stamped with a fixed time so file names are predictable
+NOW = datetime(2025, 9, 12, 15, 22, 0)
+
+ARTICLES = (
+    Article(
+        metadata=ArticleMetadata(
+            url="https://www.tempo.co/politik/article1",
+            title="Rapat Paripurna DPR",
+            category="politik",
+            publication_date="2025-09-12"
+        ),
+        content=["Paragraf pertama.", "Paragraf kedua."],
+        tags=["DPR"]
+    ),
+    Article(
+        metadata=ArticleMetadata(
+            url="/hukum/article2",
+            title="Sidang Putusan",
+            category="hukum",
+            is_free=False
+        ),
+        content=[],
+        tags=[]
+    )
+)
+
+def test_ndjson_output(tmp_path, json_backend):
+    """Test that streamed output holds a metadata line and one compact line per article"""
+    output_file = save_articles_to_ndjson(
+        list(ARTICLES), str(tmp_path), scraping_options={"extract_content": False}, now=NOW
+    )
+    assert output_file == str(tmp_path / "indeks_20250912_152200.jsonl")
+    
+    with open(output_file, 'rb') as f:
+        lines = f.read().split(b'\n')
+    
+    # Every record ends with a newline, so the last split part is empty
+    assert lines[-1] == b"", "Expected the file to end with a newline"
+    lines = lines[:-1]
+    assert len(lines) == 3, f"Expected a metadata line and 2 article lines, got {len(lines)}"
+    assert all(b'\n' not in line and b': ' not in line for line in lines), "Expected compact lines"
+    
+    assert decode_json(lines[0]) == {"metadata": {
+        "type": "index",
+        "timestamp": "2025/09/12 15:22:00",
+        "scraping_options": {"extract_content": False},
+        "total_articles": 2
+    }}
+    # Without extracted content each line keeps the simplified fields only
+    assert [decode_json(line) for line in lines[1:]] == [
+        {"url": "https://www.tempo.co/politik/article1", "title": "Rapat Paripurna DPR", "category": "politik", "is_free": True},
+        {"url": "/hukum/article2", "title": "Sidang Putusan", "category": "hukum", "is_free": False}
+    ]
+
+def test_ndjson_output_compressed(tmp_path, json_backend):
+    """Test that compressed streamed output decompresses to the same lines"""
+    scraping_options = {"extract_content": True}
+    plain_file = save_articles_to_ndjson(
+        list(ARTICLES), str(tmp_path), scraping_options, output_filename="plain", now=NOW
+    )
+    compressed_file = save_articles_to_ndjson(
+        list(ARTICLES), str(tmp_path), scraping_options, output_filename="packed", now=NOW, compress=True
+    )
+    assert compressed_file == str(tmp_path / "packed.jsonl.gz")
+    
+    with open(plain_file, 'rb') as f, gzip.open(compressed_file, 'rb') as gz:
+        assert gz.read() == f.read(), "Expected the compressed file to hold the same lines"
+    
+    # With extracted content each line holds the full article
+    with gzip.open(compressed_file, 'rb') as gz:
+        lines = gz.read().splitlines()
+    assert decode_json(lines[1])["content"] == ["Paragraf pertama.", "Paragraf kedua."]
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_atomic_open_failure(tmp_path, compress):
+    """Test that a failed write removes its temporary file and keeps the old file"""
+    output_file = tmp_path / "indeks.json"
+    output_file.write_bytes(b'{"articles":[]}')
+    
+    with pytest.raises(RuntimeError, match="interrupted"):
+        with atomic_open(str(output_file), compress=compress) as f:
+            f.write(b'{"articles":[{"title":')
+            raise RuntimeError("interrupted")
+    
+    # Only the original file is left, with its content untouched
+    assert [path.name for path in tmp_path.iterdir()] == ["indeks.json"]
+    assert output_file.read_bytes() == b'{"articles":[]}'
+
+def test_atomic_open_success(tmp_path):
+    """Test that a finished write replaces the old file and leaves nothing else behind"""
+    output_file = tmp_path / "indeks.json"
+    output_file.write_bytes(b'{"articles":[]}')
+    
+    with atomic_open(str(output_file)) as f:
+        f.write(b'{"articles":[1]}')
+        # Nothing is visible under the final name until the block finishes
+        assert output_file.read_bytes() == b'{"articles":[]}'
+    
+    assert [path.name for path in tmp_path.iterdir()] == ["indeks.json"]
+    assert output_file.read_bytes() == b'{"articles":[1]}'
+
+@pytest.mark.parametrize("is_index_scraping", [True, False])
+def test_pretty_output(tmp_path, json_backend, is_index_scraping):
+    """Test that pretty output is indented and decodes to the compact payload"""
+    outputs = {}
+    for pretty in (False, True):
+        output_file = save_articles_to_json(
+            list(ARTICLES),
+            str(tmp_path),
+            is_index_scraping=is_index_scraping,
+            scraping_options={"extract_content": True},
+            output_filename=f"pretty_{pretty}",
+            pretty=pretty,
+            now=NOW
+        )
+        with open(output_file, 'rb') as f:
+            outputs[pretty] = f.read()
+    
+    compact, indented = outputs[False], outputs[True]
+    assert b'\n' not in compact and b'": ' not in compact, "Expected compact output on one line"
+    
+    # Members are indented two spaces per level
+    lines = indented.split(b'\n')
+    assert lines[0] == b'{' and lines[-1] == b'}', f"Unexpected document framing {lines[0]!r} ... {lines[-1]!r}"
+    assert lines[1] == b'  "metadata": {', f"Expected top-level members indented by 2 spaces, got {lines[1]!r}"
+    assert lines[2].startswith(b'    "'), f"Expected nested members indented by 4 spaces, got {lines[2]!r}"
+    assert all(line == line.rstrip() for line in lines), "Expected no trailing whitespace"
+    
+    assert decode_json(indented) == decode_json(compact), "Expected pretty and compact output to hold the same data"
@@ -3,186 +3,104 @@
 Integration tests for refactored Tempo.co scraper CLI
 """
 
-import subprocess
+import contextlib
+import io
 import sys
-import os
-import json
-import glob
 
-def run_command(command, description):
-    """Run a command and return the result"""
+from tempo_scraper.main import build_parser, main
+from tempo_scraper.utils.file_handler import decode_json
+
+def run_cli(monkeypatch, work_dir, args, description):
+    """Run the scraper CLI with the given arguments in this interpreter"""
     print(f"\nTesting: {description}")
-    print(f"Command: {command}")
-    
-    try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            capture_output=True, 
-            text=True,
-            cwd='/home/fakhry/dev/scraper/tempo'
-        )
-        print("STDOUT:")
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
-        print(f"Exit code: {result.returncode}")
-        return result
-    except Exception as e:
-        print(f"Error running command: {e}")
-        return None
+    print(f"Arguments: {' '.join(args)}")
+    
+    # Call the entry point directly instead of starting a new Python
+    # process; the output, and the page cache kept with it, go to
+    # work_dir/output
+    monkeypatch.chdir(work_dir)
+    monkeypatch.setattr(sys, "argv", ["tempo_scraper", *args, "--output-dir", str(work_dir / "output")])
+    main()
 
-def test_refactored_indeks_scraper_basic():
+def read_output_files(work_dir):
+    """Decode the output files of a CLI run"""
+    documents = []
+    for path in sorted((work_dir / "output").glob("*.json*")):
+        with open(path, 'rb') as f:
+            documents.append(decode_json(f.read()))
+    return documents
+
+def test_refactored_indeks_scraper_basic(offline_site, monkeypatch, tmp_path):
     """Test basic indeks scraper functionality in refactored code"""
     print("Testing basic indeks scraper in refactored code...")
     
     # Test with limited pages and articles
-    result = run_command(
-        "python -m src.tempo_scraper indeks --start-page 1 --end-page 1 --article-per-page 1",
+    run_cli(
+        monkeypatch,
+        tmp_path,
+        ["indeks", "--start-page", "1", "--end-page", "1", "--article-per-page", "1"],
         "Scrape 1 page with 1 article per page using refactored code"
     )
     
-    if result and result.returncode == 0:
-        print("✓ Basic indeks scraper test passed for refactored code")
-        return True
-    else:
-        print("✗ Basic indeks scraper test failed for refactored code")
-        return False
+    documents = read_output_files(tmp_path)
+    assert len(documents) == 1, f"Expected 1 index file, got {len(documents)}"
+    articles = documents[0]["articles"]
+    assert [article["title"] for article in articles] == ["Rapat Paripurna DPR Sahkan Undang-Undang Baru"]
+    
+    print("✓ Basic indeks scraper test passed for refactored code")
 
-def test_refactored_article_extractor():
+def test_refactored_article_extractor(offline_site, monkeypatch, tmp_path):
     """Test article extractor functionality in refactored code"""
     print("Testing article extractor in refactored code...")
     
     # Test with a known article URL
-    result = run_command(
-        "python -m src.tempo_scraper article --url https://www.tempo.co/internasional/demo-nepal-gen-z-bendera-one-piece-2069128",
+    run_cli(
+        monkeypatch,
+        tmp_path,
+        ["article", "--url", "https://www.tempo.co/politik/rapat-paripurna-dpr-2069001"],
         "Extract article content using refactored code"
     )
     
-    if result and result.returncode == 0:
-        print("✓ Article extractor test passed for refactored code")
-        # Clean up the output file
-        files = glob.glob("/home/fakhry/dev/scraper/tempo/data/output/article_*.json")
-        for file in files:
-            try:
-                os.remove(file)
-            except:
-                pass
-        return True
-    else:
-        print("✗ Article extractor test failed for refactored code")
-        return False
+    documents = read_output_files(tmp_path)
+    assert len(documents) == 1, f"Expected 1 article file, got {len(documents)}"
+    article = documents[0]
+    assert article["metadata"]["category"] == "politik"
+    assert article["metadata"]["publication_date"] == "2025-09-12"
+    assert article["tags"] == ["DPR", "Undang-Undang"]
+    # The "Pilihan Editor:" paragraph is filtered out of the content
+    assert article["content"] == [
+        "Dewan Perwakilan Rakyat mengesahkan undang-undang baru dalam rapat paripurna.",
+        "Pengesahan dihadiri oleh perwakilan pemerintah."
+    ]
+    
+    print("✓ Article extractor test passed for refactored code")
+
+def render_help(argv):
+    """Render the CLI help for argv in this interpreter and return (exit code, text)"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            build_parser().parse_args(argv)
+            code = 0
+        except SystemExit as e:
+            code = e.code
+    return code, output.getvalue()
 
 def test_refactored_help():
     """Test help functionality in refactored code"""
     print("Testing help functionality in refactored code...")
     
-    # Test main help
-    result = run_command(
-        "python -m src.tempo_scraper --help",
-        "Show main help for refactored code"
-    )
-    
-    if result and result.returncode == 0:
-        print("✓ Main help test passed for refactored code")
-    else:
-        print("✗ Main help test failed for refactored code")
-        return False
-    
-    # Test indeks help
-    result = run_command(
-        "python -m src.tempo_scraper indeks --help",
-        "Show indeks help for refactored code"
-    )
-    
-    if result and result.returncode == 0:
-        print("✓ Indeks help test passed for refactored code")
-    else:
-        print("✗ Indeks help test failed for refactored code")
-        return False
-    
-    # Test article help
-    result = run_command(
-        "python -m src.tempo_scraper article --help",
-        "Show article help for refactored code"
-    )
-    
-    if result and result.returncode == 0:
-        print("✓ Article help test passed for refactored code")
-        return True
-    else:
-        print("✗ Article help test failed for refactored code")
-        return False
-
-def test_session_with_retry():
-    """Test that the session is created with retry strategy"""
-    print("Testing session creation with retry strategy...")
-    
-    # This test checks if the session module can be imported and creates a session correctly
-    try:
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-        from tempo_scraper.core.session import create_session
-        
-        session = create_session()
-        
-        # Check that session has the expected adapters
-        assert "http://" in session.adapters, "Session should have HTTP adapter"
-        assert "https://" in session.adapters, "Session should have HTTPS adapter"
+    # Build the help texts in-process from the one shared parser instead of
+    # starting a new Python interpreter for every subcommand
+    for argv, description, expected in (
+        (["--help"], "Main", ["indeks", "article"]),
+        (["indeks", "--help"], "Indeks", ["--start-page", "--categorize", "--output-dir"]),
+        (["article", "--help"], "Article", ["--url", "--output-dir"])
+    ):
+        code, help_text = render_help(argv)
         
-        # Check that the adapters have retry strategies
-        http_adapter = session.adapters["http://"]
-        https_adapter = session.adapters["https://"]
-        
-        # Verify that max_retries attribute exists (indicating retry strategy is set)
-        assert hasattr(http_adapter, 'max_retries'), "HTTP adapter should have max_retries attribute"
-        assert hasattr(https_adapter, 'max_retries'), "HTTPS adapter should have max_retries attribute"
-        
-        print("✓ Session creation with retry strategy test passed")
-        return True
-    except Exception as e:
-        print(f"✗ Session creation with retry strategy test failed: {e}")
-        return False
-
-def main():
-    """Run all integration tests for refactored code"""
-    print("Running integration tests for refactored Tempo.co scraper")
-    print("=" * 60)
-    
-    tests = [
-        test_refactored_help,
-        test_refactored_indeks_scraper_basic,
-        test_refactored_article_extractor,
-        test_session_with_retry
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"✗ Test {test.__name__} failed with exception: {e}")
-            failed += 1
-    
-    print("\n" + "=" * 60)
-    print("FINAL INTEGRATION TEST RESULTS FOR REFACTORED CODE")
-    print("=" * 60)
-    print(f"Total tests: {passed + failed}")
-    print(f"Passed: {passed}")
-    print(f"Failed: {failed}")
-    
-    if failed == 0:
-        print("\n🎉 ALL INTEGRATION TESTS PASSED FOR REFACTORED CODE!")
-        return True
-    else:
-        print(f"\n❌ {failed} integration test(s) failed for refactored code.")
-        return False
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+        assert code == 0, f"{description} help exited with {code}"
+        assert "usage:" in help_text, f"{description} help printed no usage"
+        for text in expected:
+            assert text in help_text, f"Expected {text} in {description.lower()} help"
+        print(f"✓ {description} help test passed for refactored code")
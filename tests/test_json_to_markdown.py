@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON to Markdown converter script
+"""
+
+import gzip
+import importlib
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(os.path.dirname(TESTS_DIR), "scripts")
+
+# Categorized scraper output and the Markdown the original, sequential
+# converter produced from it
+CATEGORIZED_DIR = os.path.join(TESTS_DIR, "fixtures", "categorized")
+GOLDEN_DIR = os.path.join(TESTS_DIR, "fixtures", "markdown")
+
+@pytest.fixture
+def converter(monkeypatch):
+    """Import the converter script the way its worker processes do, by module name"""
+    monkeypatch.syspath_prepend(SCRIPTS_DIR)
+    return importlib.import_module("json_to_markdown")
+
+def run_converter(converter, monkeypatch, input_dir, output_dir):
+    """Run the converter's command line entry point"""
+    monkeypatch.setattr(sys, "argv", ["json_to_markdown.py", str(input_dir), str(output_dir)])
+    converter.main()
+
+def read_tree(root):
+    """Read every file below root, keyed by its path relative to root"""
+    files = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                files[os.path.relpath(path, root)] = f.read()
+    return files
+
+def test_golden_output(converter, monkeypatch, capsys, tmp_path):
+    """Test that the converter writes the same Markdown as the original script"""
+    run_converter(converter, monkeypatch, CATEGORIZED_DIR, tmp_path)
+    
+    assert read_tree(tmp_path) == read_tree(GOLDEN_DIR), "Expected the Markdown files to match the golden output"
+    
+    # Each file's messages are printed together, right after its name
+    output = capsys.readouterr().out
+    assert (
+        "Processing politik.json...\n"
+        "  Created: rapat-paripurna-dpr-sahkan-undang-undang-baru.md\n"
+        "  Created: rapat-paripurna-dpr-sahkan-undang-undang-baru-1.md\n"
+        "  Created: presiden-lantik-menteri-baru-siapa-saja.md\n"
+        "  Converted 3 articles\n"
+    ) in output
+    assert (
+        "Processing hukum.json...\n"
+        "  Created: article-0.md\n"
+        "  Created: kpk-periksa-saksi-kasus-korupsi-rp-1-2-triliun.md\n"
+        "  Converted 2 articles\n"
+    ) in output
+    assert "Total articles converted: 5" in output
+
+def test_plain_and_compressed_files_of_one_category(converter, monkeypatch, tmp_path):
+    """Test that a category's plain and compressed files do not overwrite each other's Markdown"""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    with open(os.path.join(CATEGORIZED_DIR, "politik.json"), 'rb') as f:
+        data = f.read()
+    (input_dir / "politik.json").write_bytes(data)
+    (input_dir / "politik.json.gz").write_bytes(gzip.compress(data))
+    
+    output_dir = tmp_path / "output"
+    run_converter(converter, monkeypatch, input_dir, output_dir)
+    
+    # Both files are converted into the one directory, the second one
+    # numbering its names past those of the first
+    names = sorted(path.name for path in (output_dir / "politik").iterdir())
+    assert names == sorted([
+        "rapat-paripurna-dpr-sahkan-undang-undang-baru.md",
+        "rapat-paripurna-dpr-sahkan-undang-undang-baru-1.md",
+        "rapat-paripurna-dpr-sahkan-undang-undang-baru-2.md",
+        "rapat-paripurna-dpr-sahkan-undang-undang-baru-3.md",
+        "presiden-lantik-menteri-baru-siapa-saja.md",
+        "presiden-lantik-menteri-baru-siapa-saja-1.md"
+    ]), f"Unexpected Markdown files {names}"